@@ -37,6 +37,8 @@ from .examples import (
     stage6_ram_ra_virtualization,
     stage6_booleanity,
     stage7_hamming_weight_claim_reduction,
+    default_stages,
+    select_stages,
 )
 from .printer import print_sumcheck, print_spartan, print_product_virt
 from .registry import print_registry
@@ -127,20 +129,16 @@ elif cmd == "resolve":
     print_resolution()
 
 elif cmd == "html":
-    from .html import generate_html, _default_stages
+    from .html import generate_html
     selected, opts = _parse_args(sys.argv[2:])
-    all_stages = _default_stages()
-    if selected:
-        all_stages = {s: all_stages[s] for s in selected if s in all_stages}
+    all_stages = select_stages(selected) if selected else default_stages()
     out_dir = opts.get("out", "docs")
     generate_html(out_dir=out_dir, stages=all_stages)
 
 elif cmd == "latex":
-    from .latex import generate_latex, _default_stages
+    from .latex import generate_latex
     selected, opts = _parse_args(sys.argv[2:])
-    all_stages = _default_stages()
-    if selected:
-        all_stages = {s: all_stages[s] for s in selected if s in all_stages}
+    all_stages = select_stages(selected) if selected else default_stages()
     out_file = opts.get("out", "sumcheck_specs.tex")
     generate_latex(out_file=out_file, stages=all_stages)
 
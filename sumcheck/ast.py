@@ -115,7 +115,7 @@ from .defs import (  # noqa: F401 — re-exported
 # Leaf nodes — the terminals of the expression tree
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class Const:
     """A field constant.
 
@@ -132,7 +132,7 @@ class Const:
     value: Union[int, float, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class CommittedPoly:
     """An MLE committed to the PCS (polynomial commitment scheme).
 
@@ -155,7 +155,7 @@ class CommittedPoly:
     args: list[Arg]
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualPoly:
     """A virtual MLE — derived from committed ones, NOT committed.
 
@@ -179,7 +179,7 @@ class VirtualPoly:
     args: list[Arg]
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifierPoly:
     """A verifier-computable MLE — no prover help needed.
 
@@ -209,7 +209,7 @@ class VerifierPoly:
 # Internal nodes — arithmetic over sub-expressions
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class Add:
     """Sum of two expressions: left + right.
 
@@ -220,7 +220,7 @@ class Add:
     right: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Mul:
     """Product of two expressions: left · right.
 
@@ -231,7 +231,7 @@ class Mul:
     right: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Pow:
     """Integer power: base^exponent.
 
@@ -242,7 +242,7 @@ class Pow:
     exponent: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Neg:
     """Additive negation: −expr.
 
@@ -252,7 +252,7 @@ class Neg:
     expr: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Sum:
     """Hypercube summation: Σ_{var ∈ {0,1}^n} body.
 
@@ -268,7 +268,7 @@ class Sum:
     body: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class FSum:
     """Symbolic finite sum: Σ_{var=0}^{n-1} body.
 
@@ -287,7 +287,7 @@ class FSum:
     body: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class Prod:
     """Symbolic product: Π_{var=0}^{n-1} body.
 
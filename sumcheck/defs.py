@@ -18,6 +18,7 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Union
 
 
@@ -26,7 +27,7 @@ from typing import Union
 # ═══════════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DimDef:
     """One dimension of a polynomial's hypercube domain.
 
@@ -60,7 +61,7 @@ DIM_GROUP   = DimDef("2",       "group",   "constraint group")
 # ═══════════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Var:
     """A free variable being summed over in the sumcheck.
 
@@ -78,14 +79,22 @@ class Var:
         For numeric sizes (e.g. "2"), computes the actual log₂ (→ "1").
         For symbolic sizes (e.g. "T"), returns "log2(T)".
         """
-        try:
-            n = int(self.dim.size)
-            return str(int(math.log2(n)))
-        except (ValueError, TypeError):
-            return f"log2({self.dim.size})"
+        return _log_size(self.dim.size)
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=None)
+def _log_size(size: str) -> str:
+    """Var.log_size for a dimension size.  There are only a handful of
+    sizes, and the symbolic ones would otherwise raise and catch a
+    ValueError on every access."""
+    try:
+        n = int(size)
+        return str(int(math.log2(n)))
+    except (ValueError, TypeError):
+        return f"log2({size})"
+
+
+@dataclass(frozen=True, slots=True)
 class Opening:
     """A fixed opening point produced by a prior-stage sumcheck.
 
@@ -139,7 +148,7 @@ class PolyKind(Enum):
 # ═══════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class PolyDef:
     """One polynomial in the Jolt system.
 
@@ -186,7 +195,7 @@ class PolyDef:
 # ═══════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamDef:
     """One system parameter.
 
@@ -4,6 +4,10 @@ Per-stage sumcheck encodings from the Jolt specification.
 Each stage sub-package contains one file per sumcheck, named after
 the sumcheck it encodes.  All functions are re-exported here.
 
+default_stages() assembles every spec into the stage table shared by
+the html, latex and resolve outputs; select_stages() builds just a
+subset of it.
+
 Usage:
     from sumcheck.examples import stage6_ram_hamming_booleanity
     from sumcheck.examples.stage7.hamming_weight_claim_reduction import (
@@ -11,6 +15,9 @@ Usage:
     )
 """
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 from .stage1.spartan_outer import stage1_spartan_outer
 from .stage2.product_virtualization import stage2_product_virtualization
 from .stage2.ram_read_write import stage2_ram_read_write
@@ -55,4 +62,69 @@ __all__ = [
     "stage6_ram_ra_virtualization",
     "stage6_booleanity",
     "stage7_hamming_weight_claim_reduction",
+    "default_stages",
+    "select_stages",
 ]
+
+
+# stage_num → (title, spec factories), in stage order.
+_STAGE_TABLE = {
+    1: ("Spartan", (stage1_spartan_outer,)),
+    2: ("Virtualization & RAM", (
+        stage2_product_virtualization,
+        stage2_ram_read_write,
+        stage2_instruction_claim_reduction,
+        stage2_ram_raf_evaluation,
+        stage2_ram_output_check,
+    )),
+    3: ("Shift & Instruction Input", (
+        stage3_shift,
+        stage3_instruction_input,
+        stage3_registers_claim_reduction,
+    )),
+    4: ("Registers & RAM Val", (
+        stage4_registers_read_write,
+        stage4_ram_val_check,
+    )),
+    5: ("Instruction Read RAF & Reductions", (
+        stage5_instruction_read_raf,
+        stage5_ram_ra_claim_reduction,
+        stage5_registers_val_evaluation,
+    )),
+    6: ("Booleanity, Bytecode & Virtualization", (
+        stage6_ram_hamming_booleanity,
+        stage6_inc_claim_reduction,
+        stage6_bytecode_read_raf,
+        stage6_instruction_ra_virtualization,
+        stage6_ram_ra_virtualization,
+        stage6_booleanity,
+    )),
+    7: ("Hamming Weight Claim Reduction", (
+        stage7_hamming_weight_claim_reduction,
+    )),
+}
+
+
+def select_stages(selected: Iterable[int]) -> dict[int, tuple[str, list]]:
+    """Only the selected stages: stage_num → (title, [spec_objects]).
+
+    Specs are built just for those stages; unknown stage numbers are
+    ignored.  Keys come back in ascending order.
+    """
+    selected = set(selected)
+    return {
+        s: (title, [make() for make in factories])
+        for s, (title, factories) in _STAGE_TABLE.items()
+        if s in selected
+    }
+
+
+@lru_cache(maxsize=1)
+def default_stages() -> dict[int, tuple[str, list]]:
+    """All stages: stage_num → (title, [spec_objects]).
+
+    Built once per process and shared by every generator, so callers
+    must treat the result (and the specs in it) as read-only.  Keys are
+    inserted in ascending order, so iterating the dict needs no sort.
+    """
+    return select_stages(_STAGE_TABLE)
@@ -18,7 +18,9 @@ Usage:
 from __future__ import annotations
 
 import re
+import string
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Union
 
 from .defs import Arg, Var, Opening, PolyKind
@@ -27,6 +29,7 @@ from .ast import (
     Const, CommittedPoly, VirtualPoly, VerifierPoly,
     Add, Mul, Pow, Neg, Sum, FSum, Prod,
 )
+from .registry import ALL_POLYS
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -38,9 +41,16 @@ class Format(ABC):
 
     Subclass this and implement every abstract method to create a new
     output format.  Then call  render(expr, your_format)  to produce
-    a string.
+    a string.  Subclasses that define __init__ must call
+    super().__init__().
     """
 
+    __slots__ = ("_arg_dispatch",)
+
+    def __init__(self) -> None:
+        # Exact-type argument dispatch; Var and Opening are concrete leaves
+        self._arg_dispatch = {Var: self.fmt_var, Opening: self.fmt_opening}
+
     # ── Arguments ──
 
     @abstractmethod
@@ -51,36 +61,34 @@ class Format(ABC):
 
     def fmt_arg(self, a: Arg) -> str:
         """Dispatch an argument to fmt_var or fmt_opening."""
-        if isinstance(a, Var):
-            return self.fmt_var(a)
-        if isinstance(a, Opening):
-            return self.fmt_opening(a)
-        return str(a)
+        return self._arg_dispatch.get(type(a), str)(a)
 
     # ── Leaves ──
+    #
+    # Poly leaves receive their arguments already rendered and joined
+    # with ", " — arg_str is "" when the polynomial takes no arguments.
 
     @abstractmethod
     def fmt_const(self, value: Union[int, float, str]) -> str: ...
 
     @abstractmethod
-    def fmt_committed_poly(self, name: str, args: list[str]) -> str: ...
+    def fmt_committed_poly(self, name: str, arg_str: str) -> str: ...
 
     @abstractmethod
-    def fmt_virtual_poly(self, name: str, args: list[str]) -> str: ...
+    def fmt_virtual_poly(self, name: str, arg_str: str) -> str: ...
 
     @abstractmethod
-    def fmt_verifier_poly(self, name: str, args: list[str]) -> str: ...
+    def fmt_verifier_poly(self, name: str, arg_str: str) -> str: ...
 
     # ── Arithmetic ──
+    #
+    # Binary operators are plain infix separators: render() streams
+    # operands and separators into one fragment list, so a long
+    # left-associative chain costs O(n) bytes rather than O(n²).
 
-    @abstractmethod
-    def fmt_add(self, left: str, right: str) -> str: ...
-
-    @abstractmethod
-    def fmt_sub(self, left: str, right: str) -> str: ...
-
-    @abstractmethod
-    def fmt_mul(self, left: str, right: str) -> str: ...
+    add_sep: str = " + "
+    sub_sep: str = " - "
+    mul_sep: str = " * "
 
     @abstractmethod
     def fmt_pow(self, base: str, exponent: int) -> str: ...
@@ -105,6 +113,21 @@ class Format(ABC):
     def fmt_parens(self, s: str) -> str: ...
 
 
+# Binding strength of the operator context a child is rendered in.
+# Only sums and negations bind looser than a product, so they are the
+# only nodes with a tag; everything else renders bare in any context.
+_PREC_ADD = 1
+_PREC_MUL = 2
+_PREC_POW = 3
+_PREC_ATOM = 4
+_PREC = {Add: _PREC_ADD, Neg: _PREC_ADD}
+
+
+def _call_args(arg_str: str) -> str:
+    """Wrap a pre-joined argument string as "(a, b, ...)", or "" if empty."""
+    return f"({arg_str})" if arg_str else ""
+
+
 # ═══════════════════════════════════════════════════════════════════
 # Tree walker — dispatches to format methods
 # ═══════════════════════════════════════════════════════════════════
@@ -115,62 +138,150 @@ def render(expr: Expr, fmt: Format) -> str:
     Handles operator precedence (parenthesization) and subtraction
     detection (Add + Neg → sub) generically — formats only define
     *how* each node looks, not *when* to wrap.
-    """
 
-    def _r(e: Expr) -> str:
-        # ── Leaves ──
-        if isinstance(e, Const):
-            return fmt.fmt_const(e.value)
-        if isinstance(e, CommittedPoly):
-            return fmt.fmt_committed_poly(e.name, [fmt.fmt_arg(a) for a in e.args])
-        if isinstance(e, VirtualPoly):
-            return fmt.fmt_virtual_poly(e.name, [fmt.fmt_arg(a) for a in e.args])
-        if isinstance(e, VerifierPoly):
-            return fmt.fmt_verifier_poly(e.name, [fmt.fmt_arg(a) for a in e.args])
-
-        # ── Add / Sub ──
-        if isinstance(e, Add):
-            if isinstance(e.right, Neg):
-                return fmt.fmt_sub(_r(e.left), _wrap(e.right.expr, "Mul"))
-            return fmt.fmt_add(_r(e.left), _r(e.right))
-
-        # ── Mul ──
-        if isinstance(e, Mul):
-            return fmt.fmt_mul(_wrap(e.left, "Mul"), _wrap(e.right, "Mul"))
-
-        # ── Pow ──
-        if isinstance(e, Pow):
-            return fmt.fmt_pow(_wrap(e.base, "Pow"), e.exponent)
-
-        # ── Neg ──
-        if isinstance(e, Neg):
-            inner = _r(e.expr)
-            if isinstance(e.expr, (Add, Neg)):
-                inner = fmt.fmt_parens(inner)
-            return fmt.fmt_neg(inner)
-
-        # ── Sum ──
-        if isinstance(e, Sum):
-            return fmt.fmt_sum(e.var, _r(e.body))
-
-        # ── FSum ──
-        if isinstance(e, FSum):
-            return fmt.fmt_fsum(e.var, e.n, _r(e.body))
-
-        # ── Prod ──
-        if isinstance(e, Prod):
-            return fmt.fmt_prod(e.var, e.n, _r(e.body))
-
-        return repr(e)
-
-    def _wrap(e: Expr, parent_op: str) -> str:
-        """Render e, adding parens if needed inside parent_op."""
-        s = _r(e)
-        if isinstance(e, (Add, Neg)) and parent_op in ("Mul", "Pow"):
-            return fmt.fmt_parens(s)
+    Output is emitted as fragments into a single list and joined once
+    at the end.  Nodes whose format method needs the rendered child as
+    a string (parens, powers, sums) slice it back off the list.
+    """
+    out: list[str] = []
+    emit = out.append
+
+    # Specialize to this format instance: bind its methods and
+    # separators once, so the per-node handlers below do no attribute
+    # lookups on fmt.
+    fmt_const = fmt.fmt_const
+    fmt_committed_poly = fmt.fmt_committed_poly
+    fmt_virtual_poly = fmt.fmt_virtual_poly
+    fmt_verifier_poly = fmt.fmt_verifier_poly
+    fmt_pow = fmt.fmt_pow
+    fmt_neg = fmt.fmt_neg
+    fmt_sum = fmt.fmt_sum
+    fmt_fsum = fmt.fmt_fsum
+    fmt_prod = fmt.fmt_prod
+    fmt_parens = fmt.fmt_parens
+    fmt_arg = fmt.fmt_arg
+    add_sep, sub_sep, mul_sep = fmt.add_sep, fmt.sub_sep, fmt.mul_sep
+
+    def _capture(e: Expr, parent_prec: int | None = None) -> str:
+        """Render e to a string via the shared fragment list."""
+        mark = len(out)
+        if parent_prec is None:
+            _r(e)
+        else:
+            _wrap(e, parent_prec)
+        s = "".join(out[mark:])
+        del out[mark:]
         return s
 
-    return _r(expr)
+    # ── Leaves ──
+
+    def _const(e: Const) -> None:
+        emit(fmt_const(e.value))
+
+    def _committed(e: CommittedPoly) -> None:
+        emit(fmt_committed_poly(e.name, _args(e.args)))
+
+    def _virtual(e: VirtualPoly) -> None:
+        emit(fmt_virtual_poly(e.name, _args(e.args)))
+
+    def _verifier(e: VerifierPoly) -> None:
+        emit(fmt_verifier_poly(e.name, _args(e.args)))
+
+    # ── Add / Sub ──
+
+    # add()/mul() build left-associative chains — Add(Add(a, b), c) —
+    # so both handlers walk the left spine iteratively and emit the
+    # operands in order, rather than recursing once per term.
+
+    def _add(e: Add) -> None:
+        terms: list[Expr] = []
+        while type(e) is Add:
+            terms.append(e.right)
+            e = e.left
+        _r(e)
+        for t in reversed(terms):
+            if isinstance(t, Neg):
+                # a + (-b) → a - b: render b directly; the Neg node
+                # itself is never formatted on this path.
+                emit(sub_sep)
+                _wrap(t.expr, _PREC_MUL)
+            else:
+                emit(add_sep)
+                _r(t)
+
+    # ── Mul ──
+
+    def _mul(e: Mul) -> None:
+        factors: list[Expr] = []
+        while type(e) is Mul:
+            factors.append(e.right)
+            e = e.left
+        _wrap(e, _PREC_MUL)
+        for f in reversed(factors):
+            emit(mul_sep)
+            _wrap(f, _PREC_MUL)
+
+    # ── Pow ──
+
+    def _pow(e: Pow) -> None:
+        emit(fmt_pow(_capture(e.base, _PREC_POW), e.exponent))
+
+    # ── Neg ──
+
+    def _neg(e: Neg) -> None:
+        emit(fmt_neg(_capture(e.expr, _PREC_MUL)))
+
+    # ── Aggregations ──
+
+    def _sum(e: Sum) -> None:
+        emit(fmt_sum(e.var, _capture(e.body)))
+
+    def _fsum(e: FSum) -> None:
+        emit(fmt_fsum(e.var, e.n, _capture(e.body)))
+
+    def _prod(e: Prod) -> None:
+        emit(fmt_prod(e.var, e.n, _capture(e.body)))
+
+    # Exact-type dispatch: every AST node class is concrete, so one dict
+    # lookup replaces a ladder of up to eleven isinstance checks.
+    dispatch = {
+        Const: _const,
+        CommittedPoly: _committed,
+        VirtualPoly: _virtual,
+        VerifierPoly: _verifier,
+        Add: _add,
+        Mul: _mul,
+        Pow: _pow,
+        Neg: _neg,
+        Sum: _sum,
+        FSum: _fsum,
+        Prod: _prod,
+    }
+
+    def _r(e: Expr) -> None:
+        handler = dispatch.get(type(e))
+        if handler is None:
+            emit(repr(e))
+        else:
+            handler(e)
+
+    def _args(args: list[Arg]) -> str:
+        """Render a leaf's arguments as one comma-joined string ("" if none)."""
+        if not args:
+            return ""
+        if len(args) == 1:
+            return fmt_arg(args[0])
+        return ", ".join(map(fmt_arg, args))
+
+    def _wrap(e: Expr, parent_prec: int) -> None:
+        """Render e, adding parens if it binds looser than parent_prec."""
+        if _PREC.get(type(e), _PREC_ATOM) < parent_prec:
+            emit(fmt_parens(_capture(e)))
+        else:
+            _r(e)
+
+    _r(expr)
+    return "".join(out)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -180,54 +291,55 @@ def render(expr: Expr, fmt: Format) -> str:
 class TextFormat(Format):
     """Plain-text rendering matching the original printer.fmt() output."""
 
-    def fmt_var(self, v):
-        return v.name
+    mul_sep: str = " · "
 
-    def fmt_opening(self, o):
-        return f"r_{o.print_label}^({o.stage})"
+    __slots__ = ("_opening_cache",)
 
-    def fmt_const(self, value):
-        return str(value)
+    def __init__(self) -> None:
+        super().__init__()
+        # (print_label, stage) → rendered opening; openings repeat heavily
+        self._opening_cache: dict[tuple[str, int], str] = {}
 
-    def fmt_committed_poly(self, name, args):
-        arg_str = ", ".join(args)
-        return f"cp:{name}({arg_str})" if args else f"cp:{name}"
+    def fmt_var(self, v: Var) -> str:
+        return v.name
 
-    def fmt_virtual_poly(self, name, args):
-        arg_str = ", ".join(args)
-        return f"vp:{name}({arg_str})" if args else f"vp:{name}"
+    def fmt_opening(self, o: Opening) -> str:
+        key = (o.print_label, o.stage)
+        cached = self._opening_cache.get(key)
+        if cached is None:
+            cached = self._opening_cache[key] = f"r_{o.print_label}^({o.stage})"
+        return cached
 
-    def fmt_verifier_poly(self, name, args):
-        arg_str = ", ".join(args)
-        return f"{name}:{name}({arg_str})" if args else f"{name}:{name}"
+    def fmt_const(self, value: Union[int, float, str]) -> str:
+        return str(value)
 
-    def fmt_add(self, left, right):
-        return f"{left} + {right}"
+    def fmt_committed_poly(self, name: str, arg_str: str) -> str:
+        return f"cp:{name}{_call_args(arg_str)}"
 
-    def fmt_sub(self, left, right):
-        return f"{left} - {right}"
+    def fmt_virtual_poly(self, name: str, arg_str: str) -> str:
+        return f"vp:{name}{_call_args(arg_str)}"
 
-    def fmt_mul(self, left, right):
-        return f"{left} · {right}"
+    def fmt_verifier_poly(self, name: str, arg_str: str) -> str:
+        return f"{name}:{name}{_call_args(arg_str)}"
 
-    def fmt_pow(self, base, exponent):
+    def fmt_pow(self, base: str, exponent: int) -> str:
         return f"{base}^{exponent}"
 
-    def fmt_neg(self, inner):
+    def fmt_neg(self, inner: str) -> str:
         return f"-{inner}"
 
-    def fmt_sum(self, var, body):
+    def fmt_sum(self, var: Var, body: str) -> str:
         return f"Σ_{{{var.name}}} {body}"
 
-    def fmt_fsum(self, index_var, n, body):
+    def fmt_fsum(self, index_var: str, n: Union[int, str], body: str) -> str:
         upper = n - 1 if isinstance(n, int) else f"{n}-1"
         return f"Σ_{{{index_var}=0}}^{{{upper}}} {body}"
 
-    def fmt_prod(self, index_var, n, body):
+    def fmt_prod(self, index_var: str, n: Union[int, str], body: str) -> str:
         upper = n - 1 if isinstance(n, int) else f"{n}-1"
         return f"Π_{{{index_var}=0}}^{{{upper}}} {body}"
 
-    def fmt_parens(self, s):
+    def fmt_parens(self, s: str) -> str:
         return f"({s})"
 
 
@@ -235,17 +347,56 @@ class TextFormat(Format):
 # LatexFormat — LaTeX math output (for KaTeX / MathJax / .tex)
 # ═══════════════════════════════════════════════════════════════════
 
-# Unicode → LaTeX replacements for symbolic Const values
-_UNICODE_TO_LATEX = [
-    ("γ", "\\gamma"),
-    ("·", "\\cdot "),
-    ("∪", "\\cup "),
-    ("∈", "\\in "),
-    ("Σ", "\\sum"),
-    ("Π", "\\prod"),
-]
+# Character classes for the hand-written name scanners below
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_LOWER_DIGIT = _LOWER | frozenset(string.digits)
 
+# Fixed LaTeX decorations, built once at import rather than per node
+_COMMITTED_OPEN = "\\textcolor{ForestGreen}{"
+_VIRTUAL_OPEN = "\\textcolor{BurntOrange}{"
+_EQ_TILDE = "\\widetilde{\\text{eq}}"
 
+# Colour wrapper per registry kind, for opening entries (best-effort)
+_KIND_OPEN = {
+    PolyKind.COMMITTED: _COMMITTED_OPEN,
+    PolyKind.VIRTUAL: _VIRTUAL_OPEN,
+}
+
+
+def _build_kind_by_name() -> dict[str, PolyKind | None]:
+    """Registry name → kind, or None if the name is ambiguous.
+
+    InstructionRa(i), for example, is registered both as a committed
+    chunk and as a virtual product, so it gets no colour.
+    """
+    kinds: dict[str, PolyKind | None] = {}
+    for p in ALL_POLYS:
+        kinds[p.name] = None if p.name in kinds else p.kind
+    return kinds
+
+
+_KIND_BY_NAME = _build_kind_by_name()
+
+# Unicode → LaTeX replacements for symbolic Const values, as a
+# str.translate table so every character is handled in one pass
+_UNICODE_TO_LATEX = str.maketrans({
+    "γ": "\\gamma",
+    "·": "\\cdot ",
+    "∪": "\\cup ",
+    "∈": "\\in ",
+    "Σ": "\\sum",
+    "Π": "\\prod",
+})
+
+# Bare multi-digit exponent: 2^64
+_RE_MULTIDIGIT_EXP = re.compile(r"\^(\d{2,})")
+
+# Subscripted parameter inside a for clause, captured so re.split keeps it
+_RE_CLAUSE_PARAM = re.compile(r"([A-Za-z]_[a-z][a-z0-9]*)")
+
+
+@lru_cache(maxsize=4096)
 def _latex_poly_name(name: str) -> str:
     """Convert a polynomial name to LaTeX with proper subscript handling.
 
@@ -262,19 +413,27 @@ def _latex_poly_name(name: str) -> str:
         io_mask             → \\textsf{io\\_mask}
     """
     # Single uppercase letter + subscript: T_j, W_1 — already valid LaTeX
-    if re.match(r"^[A-Z]_[a-z0-9]+$", name):
+    if (len(name) > 2 and name[0] in _UPPER and name[1] == "_"
+            and all(c in _LOWER_DIGIT for c in name[2:])):
         return name
 
     # Split Name(Qualifier) from base
-    m = re.match(r"^([^(]+)\((.+)\)$", name)
-    if m:
-        base = _latex_base(m.group(1))
-        qual = _latex_qualifier(m.group(2))
+    lparen = name.find("(")
+    if lparen > 0 and len(name) - lparen > 2 and name[-1] == ")":
+        base = _latex_base(name[:lparen])
+        qual = _latex_qualifier(name[lparen + 1:-1])
         return f"{base}({qual})"
 
     return _latex_base(name)
 
 
+def _trailing_subscript(name: str) -> bool:
+    """True if name ends in _X with X a lowercase letter or digit, and
+    has at least one character before the underscore."""
+    return len(name) > 2 and name[-2] == "_" and name[-1] in _LOWER_DIGIT
+
+
+@lru_cache(maxsize=4096)
 def _latex_base(name: str) -> str:
     """Render the base part of a polynomial name.
 
@@ -282,13 +441,13 @@ def _latex_base(name: str) -> str:
         Ra_j  → \\textsf{Ra}_j
         Ra    → \\textsf{Ra}
     """
-    m = re.match(r"^(.+?)_([a-z0-9])$", name)
-    if m:
-        return f"\\textsf{{{m.group(1)}}}_{{{m.group(2)}}}"
+    if _trailing_subscript(name):
+        return f"\\textsf{{{name[:-2]}}}_{{{name[-1]}}}"
     escaped = name.replace("_", r"\_")
     return f"\\textsf{{{escaped}}}"
 
 
+@lru_cache(maxsize=4096)
 def _latex_qualifier(qual: str) -> str:
     """Render the parenthesized qualifier of a polynomial name.
 
@@ -297,29 +456,38 @@ def _latex_qualifier(qual: str) -> str:
     Word              → \\text{}:   Load, Branch, LeftOperandIsRs1Value
     """
     # Single lowercase letter: i, j
-    if re.match(r"^[a-z]$", qual):
+    if len(qual) == 1 and qual in _LOWER:
         return qual
     # Variable with subscript: cf_i
-    m = re.match(r"^([a-z]+)_([a-z0-9])$", qual)
-    if m:
-        return f"\\text{{{m.group(1)}}}_{{{m.group(2)}}}"
+    if _trailing_subscript(qual) and all(c in _LOWER for c in qual[:-2]):
+        return f"\\text{{{qual[:-2]}}}_{{{qual[-1]}}}"
     # Word (starts with uppercase, or multi-char): Load, Branch, IsRdNotZero
     return f"\\text{{{qual}}}"
 
 
+@lru_cache(maxsize=4096)
 def _latex_verifier_name(name: str) -> str:
     """Convert a verifier polynomial name to LaTeX."""
     if name == "eq":
-        return "\\widetilde{\\text{eq}}"
+        return _EQ_TILDE
     if name.startswith("eq_"):
-        suffix = name[3:]
-        return f"\\widetilde{{\\text{{eq}}}}_{{{suffix}}}"
+        return f"{_EQ_TILDE}_{{{name[3:]}}}"
     if name.endswith("_tilde"):
         base = name[:-6]
         return f"\\widetilde{{{_latex_poly_name(base)}}}"
     return _latex_poly_name(name)
 
 
+@lru_cache(maxsize=4096)
+def _latex_subscript(base: str, sub: str) -> str:
+    """Attach a subscript to a single-letter base: one character stays
+    bare (d_v), anything longer is set upright (K_{\\text{ram}})."""
+    if len(sub) == 1:
+        return f"{base}_{sub}"
+    return f"{base}_{{\\text{{{sub}}}}}"
+
+
+@lru_cache(maxsize=4096)
 def _latex_param(s: str) -> str:
     """Format a parameter/dimension name for LaTeX.
 
@@ -331,13 +499,11 @@ def _latex_param(s: str) -> str:
     """
     m = re.match(r'^([A-Za-z])_([a-z0-9]+)$', s)
     if m:
-        base, sub = m.group(1), m.group(2)
-        if len(sub) == 1:
-            return f"{base}_{sub}"
-        return f"{base}_{{\\text{{{sub}}}}}"
+        return _latex_subscript(m.group(1), m.group(2))
     return s
 
 
+@lru_cache(maxsize=4096)
 def _latex_opening_label(label: str) -> str:
     """Format an opening-point label for LaTeX.
 
@@ -357,10 +523,7 @@ def _latex_opening_label(label: str) -> str:
     # Param_subscript: K_instr, N_v
     m2 = re.match(r'^([A-Z])_([a-z][a-z0-9]*)$', label)
     if m2:
-        base, sub_text = m2.group(1), m2.group(2)
-        if len(sub_text) == 1:
-            return f"{base}_{sub_text}{sup}"
-        return f"{base}_{{\\text{{{sub_text}}}}}{sup}"
+        return f"{_latex_subscript(m2.group(1), m2.group(2))}{sup}"
 
     # Single uppercase letter
     if re.match(r'^[A-Z]$', label):
@@ -375,21 +538,20 @@ def _latex_opening_label(label: str) -> str:
     return f"\\text{{{label}}}{sup}"
 
 
+@lru_cache(maxsize=4096)
 def _latex_for_clause(clause: str) -> str:
     """Format a 'for' clause with proper LaTeX parameter names.
 
     i=0..d_v-1           → i=0,\\ldots,d_v-1
     j=0..N_ra-1 (...)    → j=0,\\ldots,N_{\\text{ra}}-1 (...)
     """
-    result = clause.replace("..", ",\\ldots,")
-    result = re.sub(
-        r'([A-Za-z])_([a-z][a-z0-9]*)',
-        lambda m: _latex_param(m.group(0)),
-        result,
-    )
-    return result
+    # re.split with a capturing group puts the parameters at odd indices
+    parts = _RE_CLAUSE_PARAM.split(clause.replace("..", ",\\ldots,"))
+    parts[1::2] = map(_latex_param, parts[1::2])
+    return "".join(parts)
 
 
+@lru_cache(maxsize=4096)
 def latex_dim_expr(s: str) -> str:
     """Format a dimension/round expression for LaTeX.
 
@@ -410,8 +572,6 @@ def latex_opening_entry(name: str, args: list, fmt: 'LatexFormat') -> str:
     Simple: "RamVal" → \\textcolor{BurntOrange}{\\textsf{RamVal}}(args)
     Parametric: "InstructionRa(i) for i=0..d_v-1" → formatted poly + clause
     """
-    from .registry import ALL_POLYS
-
     # Split "PolyName for clause"
     poly_name = name
     for_clause = ""
@@ -422,16 +582,12 @@ def latex_opening_entry(name: str, args: list, fmt: 'LatexFormat') -> str:
     latex_name = _latex_poly_name(poly_name)
 
     # Determine colour from registry (best-effort)
-    _COLOUR = {
-        PolyKind.COMMITTED: "ForestGreen",
-        PolyKind.VIRTUAL: "BurntOrange",
-    }
-    matches = [p for p in ALL_POLYS if p.name == poly_name]
-    if len(matches) == 1 and matches[0].kind in _COLOUR:
-        latex_name = f"\\textcolor{{{_COLOUR[matches[0].kind]}}}{{{latex_name}}}"
+    kind = _KIND_BY_NAME.get(poly_name)
+    if kind in _KIND_OPEN:
+        latex_name = f"{_KIND_OPEN[kind]}{latex_name}}}"
 
     # Format args
-    arg_str = ", ".join(fmt.fmt_arg(a) for a in args)
+    arg_str = ", ".join(map(fmt.fmt_arg, args))
 
     result = f"{latex_name}({arg_str})"
     if for_clause:
@@ -448,65 +604,60 @@ class LatexFormat(Format):
         \\widetilde{\\text{eq}}       for the eq polynomial
     """
 
-    def fmt_var(self, v):
+    mul_sep: str = " \\cdot "
+
+    __slots__ = ("_opening_cache",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # (print_label, stage) → rendered opening; openings repeat heavily
+        self._opening_cache: dict[tuple[str, int], str] = {}
+
+    def fmt_var(self, v: Var) -> str:
         return v.name  # X_t, X_k — already valid LaTeX
 
-    def fmt_opening(self, o):
-        label = _latex_opening_label(o.print_label)
-        return f"r_{{{label}}}^{{({o.stage})}}"
+    def fmt_opening(self, o: Opening) -> str:
+        key = (o.print_label, o.stage)
+        cached = self._opening_cache.get(key)
+        if cached is None:
+            label = _latex_opening_label(o.print_label)
+            cached = self._opening_cache[key] = f"r_{{{label}}}^{{({o.stage})}}"
+        return cached
 
-    def fmt_const(self, value):
+    def fmt_const(self, value: Union[int, float, str]) -> str:
         if isinstance(value, (int, float)):
             return str(value)
-        s = str(value)
-        for uchar, ltx in _UNICODE_TO_LATEX:
-            s = s.replace(uchar, ltx)
+        s = str(value).translate(_UNICODE_TO_LATEX)
         # Wrap bare multi-digit exponents: 2^64 → 2^{64}
-        s = re.sub(r"\^(\d{2,})", r"^{\1}", s)
-        return s
+        return _RE_MULTIDIGIT_EXP.sub(r"^{\1}", s)
 
-    def fmt_committed_poly(self, name, args):
-        arg_str = ", ".join(args)
+    def fmt_committed_poly(self, name: str, arg_str: str) -> str:
         latex_name = _latex_poly_name(name)
-        colored = f"\\textcolor{{ForestGreen}}{{{latex_name}}}"
-        return f"{colored}({arg_str})" if args else colored
+        return f"{_COMMITTED_OPEN}{latex_name}}}{_call_args(arg_str)}"
 
-    def fmt_virtual_poly(self, name, args):
-        arg_str = ", ".join(args)
+    def fmt_virtual_poly(self, name: str, arg_str: str) -> str:
         latex_name = _latex_poly_name(name)
-        colored = f"\\textcolor{{BurntOrange}}{{{latex_name}}}"
-        return f"{colored}({arg_str})" if args else colored
-
-    def fmt_verifier_poly(self, name, args):
-        arg_str = ", ".join(args)
-        latex_name = _latex_verifier_name(name)
-        return f"{latex_name}({arg_str})" if args else latex_name
-
-    def fmt_add(self, left, right):
-        return f"{left} + {right}"
-
-    def fmt_sub(self, left, right):
-        return f"{left} - {right}"
+        return f"{_VIRTUAL_OPEN}{latex_name}}}{_call_args(arg_str)}"
 
-    def fmt_mul(self, left, right):
-        return f"{left} \\cdot {right}"
+    def fmt_verifier_poly(self, name: str, arg_str: str) -> str:
+        return f"{_latex_verifier_name(name)}{_call_args(arg_str)}"
 
-    def fmt_pow(self, base, exponent):
+    def fmt_pow(self, base: str, exponent: int) -> str:
         return f"{base}^{{{exponent}}}"
 
-    def fmt_neg(self, inner):
+    def fmt_neg(self, inner: str) -> str:
         return f"-{inner}"
 
-    def fmt_sum(self, var, body):
+    def fmt_sum(self, var: Var, body: str) -> str:
         return f"\\sum_{{{var.name} \\in \\{{0,1\\}}^{{{var.log_size}}}}} {body}"
 
-    def fmt_fsum(self, index_var, n, body):
+    def fmt_fsum(self, index_var: str, n: Union[int, str], body: str) -> str:
         upper = n - 1 if isinstance(n, int) else f"{n}-1"
         return f"\\sum_{{{index_var}=0}}^{{{upper}}} {body}"
 
-    def fmt_prod(self, index_var, n, body):
+    def fmt_prod(self, index_var: str, n: Union[int, str], body: str) -> str:
         upper = n - 1 if isinstance(n, int) else f"{n}-1"
         return f"\\prod_{{{index_var}=0}}^{{{upper}}} {body}"
 
-    def fmt_parens(self, s):
+    def fmt_parens(self, s: str) -> str:
         return f"\\left({s}\\right)"
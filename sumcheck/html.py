@@ -12,6 +12,7 @@ Usage:
 from __future__ import annotations
 
 import html as html_mod
+from functools import lru_cache
 from pathlib import Path
 
 from .defs import Arg, Var, Opening, PolyKind
@@ -21,23 +22,61 @@ from .format import (
     render, LatexFormat, latex_dim_expr, latex_opening_entry,
     _latex_poly_name, _latex_param,
 )
+from .registry import COMMITTED_POLYS, VIRTUAL_POLYS, VERIFIER_POLYS, PARAMS
 
 _FMT = LatexFormat()
 
+# id(expr) → (expr, latex) for the build in progress.  AST nodes are
+# mutable dataclasses and so unhashable; holding a reference to each
+# node keeps its id from being reused while the entry is live.
+# generate_html clears the memos when it finishes.
+_RENDER_CACHE: dict[int, tuple[Expr, str]] = {}
+
+# (poly name, id(args)) → (args, latex), same scheme: every opening is
+# rendered on its stage page and again on the openings overview.
+_OPENING_CACHE: dict[tuple[str, int], tuple[list[Arg], str]] = {}
+
 
 # ═══════════════════════════════════════════════════════════════════
 # Expression / argument helpers
 # ═══════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=4096)
+def _esc(s: str) -> str:
+    """html.escape, memoized: spec names and labels recur across pages."""
+    return html_mod.escape(s)
+
+
+def _render_cached(expr: Expr) -> str:
+    """render(expr, _FMT), memoized on node identity."""
+    hit = _RENDER_CACHE.get(id(expr))
+    if hit is not None:
+        return hit[1]
+    latex = render(expr, _FMT)
+    _RENDER_CACHE[id(expr)] = (expr, latex)
+    return latex
+
+
+def _opening_cached(name: str, args: list[Arg]) -> str:
+    """latex_opening_entry(name, args, _FMT), memoized on args identity."""
+    key = (name, id(args))
+    hit = _OPENING_CACHE.get(key)
+    if hit is not None:
+        return hit[1]
+    latex = latex_opening_entry(name, args, _FMT)
+    _OPENING_CACHE[key] = (args, latex)
+    return latex
+
+
 def _math(expr: Expr) -> str:
     """Render an expression as a KaTeX display-math block."""
-    latex = render(expr, _FMT)
+    latex = _render_cached(expr)
     return f'<div class="math-block">$${latex}$$</div>'
 
 
 def _inline(expr: Expr) -> str:
     """Render an expression as inline KaTeX."""
-    return f"${render(expr, _FMT)}$"
+    return f"${_render_cached(expr)}$"
 
 
 def _arg(a: Arg) -> str:
@@ -51,7 +90,7 @@ def _opening_list(openings: list[tuple[str, list[Arg]]]) -> str:
         return ""
     items = []
     for name, args in openings:
-        entry = latex_opening_entry(name, args, _FMT)
+        entry = _opening_cached(name, args)
         items.append(f'<li>${entry}$</li>')
     return f"""
     <div class="spec-section">
@@ -74,7 +113,7 @@ def _render_sumcheck(sc: SumcheckSpec) -> str:
         pt_str = ", ".join(_FMT.fmt_arg(o) for o in sc.opening_point)
         opening_pt = f'<div class="meta-item"><span class="meta-label">Opening point</span> $({pt_str})$</div>'
 
-    anchor = html_mod.escape(sc.name)
+    anchor = _esc(sc.name)
     return f"""
     <section class="sumcheck-card" id="{anchor}">
       <h3>{anchor}</h3>
@@ -100,7 +139,7 @@ def _render_sumcheck(sc: SumcheckSpec) -> str:
 
 def _render_spartan(sp: SpartanSpec) -> str:
     """Render a SpartanSpec as an HTML section."""
-    anchor = html_mod.escape(sp.name)
+    anchor = _esc(sp.name)
     parts = [f"""
     <section class="sumcheck-card" id="{anchor}">
       <h3>{anchor}</h3>
@@ -126,20 +165,10 @@ def _render_spartan(sp: SpartanSpec) -> str:
         {_math(sp.input_claim)}
       </div>"""]
 
+    # Table rows are spliced straight into parts as small fragments,
+    # so no per-row or per-table string is built and then re-copied.
+    extend = parts.extend
     for gi, group in enumerate(sp.groups):
-        rows = []
-        for ci, c in enumerate(group):
-            idx = sp.constraint_domain[ci] if ci < len(sp.constraint_domain) else ci
-            az_latex = render(c.az, _FMT)
-            bz_latex = render(c.bz, _FMT)
-            rows.append(f"""
-            <tr>
-              <td class="idx">{idx}</td>
-              <td class="label">{html_mod.escape(c.label)}</td>
-              <td class="math-cell">${az_latex}$</td>
-              <td class="math-cell">${bz_latex}$</td>
-            </tr>""")
-
         parts.append(f"""
       <div class="spec-section">
         <h4>Group {gi} (${sp.group_var.name} = {gi}$)</h4>
@@ -148,7 +177,17 @@ def _render_spartan(sp: SpartanSpec) -> str:
           <thead>
             <tr><th>c</th><th>Label</th><th>$A_z$ (guard)</th><th>$B_z$ (value)</th></tr>
           </thead>
-          <tbody>{"".join(rows)}
+          <tbody>""")
+        for ci, c in enumerate(group):
+            idx = sp.constraint_domain[ci] if ci < len(sp.constraint_domain) else ci
+            extend((
+                '\n            <tr>\n              <td class="idx">', str(idx),
+                '</td>\n              <td class="label">', _esc(c.label),
+                '</td>\n              <td class="math-cell">$', _render_cached(c.az),
+                '$</td>\n              <td class="math-cell">$', _render_cached(c.bz),
+                '$</td>\n            </tr>',
+            ))
+        parts.append("""
           </tbody>
         </table>
         </div>
@@ -161,23 +200,8 @@ def _render_spartan(sp: SpartanSpec) -> str:
 
 def _render_product_virt(pv: ProductVirtSpec) -> str:
     """Render a ProductVirtSpec as an HTML section."""
-    rows = []
-    for ci, c in enumerate(pv.constraints):
-        idx = pv.constraint_domain[ci]
-        out_latex = render(c.output, _FMT)
-        left_latex = render(c.left, _FMT)
-        right_latex = render(c.right, _FMT)
-        rows.append(f"""
-            <tr>
-              <td class="idx">{idx}</td>
-              <td class="label">{html_mod.escape(c.label)}</td>
-              <td class="math-cell">${out_latex}$</td>
-              <td class="math-cell">${left_latex}$</td>
-              <td class="math-cell">${right_latex}$</td>
-            </tr>""")
-
-    anchor = html_mod.escape(pv.name)
-    return f"""
+    anchor = _esc(pv.name)
+    parts = [f"""
     <section class="sumcheck-card" id="{anchor}">
       <h3>{anchor}</h3>
       <div class="metadata">
@@ -204,13 +228,27 @@ def _render_product_virt(pv: ProductVirtSpec) -> str:
           <thead>
             <tr><th>c</th><th>Label</th><th>Output</th><th>Left</th><th>Right</th></tr>
           </thead>
-          <tbody>{"".join(rows)}
+          <tbody>"""]
+
+    extend = parts.extend
+    for ci, c in enumerate(pv.constraints):
+        extend((
+            '\n            <tr>\n              <td class="idx">', str(pv.constraint_domain[ci]),
+            '</td>\n              <td class="label">', _esc(c.label),
+            '</td>\n              <td class="math-cell">$', _render_cached(c.output),
+            '$</td>\n              <td class="math-cell">$', _render_cached(c.left),
+            '$</td>\n              <td class="math-cell">$', _render_cached(c.right),
+            '$</td>\n            </tr>',
+        ))
+
+    parts.append(f"""
           </tbody>
         </table>
         </div>
       </div>
       {_opening_list(pv.openings)}
-    </section>"""
+    </section>""")
+    return "".join(parts)
 
 
 def _render_spec(spec) -> str:
@@ -356,60 +394,98 @@ h1 {
 """
 
 
-def _page(title: str, body: str, active_page: str, total_stages: int = 7) -> str:
-    """Wrap body content in a full HTML page with KaTeX and nav.
-
-    active_page: "index", "stage1".."stage7", "openings", or "polynomials"
-    """
-    nav_links = ['<a href="index.html"{}>{}</a>'.format(
-        ' class="active"' if active_page == "index" else "", "Overview")]
-    for s in range(1, total_stages + 1):
-        cls = ' class="active"' if active_page == f"stage{s}" else ""
-        nav_links.append(f'<a href="stage{s}.html"{cls}>Stage {s}</a>')
-    for page, label in [("openings", "Openings"), ("polynomials", "Polynomials"), ("resolve", "Resolve")]:
-        cls = ' class="active"' if active_page == page else ""
-        nav_links.append(f'<a href="{page}.html"{cls}>{label}</a>')
-    nav = "\n    ".join(nav_links)
-
-    return f"""<!DOCTYPE html>
+# Static page shell, split around the per-page slots (title, extra CSS,
+# nav, body) so _page only joins fragments.  The shared stylesheet is
+# written once per build as style.css.
+_HEAD_PRE = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>{html_mod.escape(title)}</title>
+  <title>"""
+
+# The KaTeX stylesheet pulls its fonts from the CDN only after it has
+# been parsed; the CORS-mode preconnect has that connection warm by then.
+_HEAD_STYLE = """</title>
+  <link rel="preconnect" href="https://cdn.jsdelivr.net" crossorigin>
   <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.css">
   <script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/katex.min.js"></script>
   <script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.11/dist/contrib/auto-render.min.js"
-    onload="renderMathInElement(document.body, {{
+    onload="renderMathInElement(document.body, {
       delimiters: [
-        {{left: '$$', right: '$$', display: true}},
-        {{left: '$', right: '$', display: false}}
+        {left: '$$', right: '$$', display: true},
+        {left: '$', right: '$', display: false}
       ],
       throwOnError: false
-    }});"></script>
-  <style>{_CSS}</style>
+    });"></script>
+  <link rel="stylesheet" href="style.css">"""
+
+_HEAD_NAV = """
 </head>
 <body>
   <nav>
-    {nav}
+    """
+
+_BODY_PRE = """
   </nav>
-  <h1>{html_mod.escape(title)}</h1>
-  {body}
+  <h1>"""
+
+_BODY_POST = """
 </body>
 </html>"""
 
 
+@lru_cache(maxsize=None)
+def _nav_links(total_stages: int) -> tuple[dict[str, int], tuple[str, ...], tuple[str, ...]]:
+    """Nav anchors for a site with total_stages stage pages.
+
+    Returns (position of each page key, plain anchors, active anchors);
+    _page swaps in the one active anchor it needs.
+    """
+    items = [("index", "Overview")]
+    items += [(f"stage{s}", f"Stage {s}") for s in range(1, total_stages + 1)]
+    items += [("openings", "Openings"), ("polynomials", "Polynomials"), ("resolve", "Resolve")]
+    position = {key: i for i, (key, _label) in enumerate(items)}
+    plain = tuple(f'<a href="{key}.html">{label}</a>' for key, label in items)
+    active = tuple(f'<a href="{key}.html" class="active">{label}</a>' for key, label in items)
+    return position, plain, active
+
+
+def _page(
+    title: str, body: str, active_page: str, total_stages: int = 7, extra_css: str = "",
+) -> str:
+    """Wrap body content in a full HTML page with KaTeX and nav.
+
+    active_page: "index", "stage1".."stage7", "openings", or "polynomials"
+    extra_css:   page-specific rules, inlined after the shared stylesheet
+    """
+    position, plain, active = _nav_links(total_stages)
+    i = position.get(active_page)
+    if i is None:
+        nav_links = plain
+    else:
+        nav_links = list(plain)
+        nav_links[i] = active[i]
+    nav = "\n    ".join(nav_links)
+    escaped_title = _esc(title)
+    page_style = f"\n  <style>{extra_css}</style>" if extra_css else ""
+
+    return "".join((
+        _HEAD_PRE, escaped_title, _HEAD_STYLE, page_style, _HEAD_NAV, nav,
+        _BODY_PRE, escaped_title, "</h1>\n  ", body, _BODY_POST,
+    ))
+
+
 def _index_page(stages: dict[int, tuple[str, list]], total_stages: int = 7) -> str:
     """Generate the overview/index page."""
     cards = []
-    for s in sorted(stages.keys()):
-        title, specs = stages[s]
+    for s, (title, specs) in stages.items():
         count = len(specs)
         cards.append(f"""
     <a href="stage{s}.html" class="stage-link">
       <div class="sumcheck-card">
         <h3>Stage {s}</h3>
-        <p>{html_mod.escape(title)}</p>
+        <p>{_esc(title)}</p>
         <p class="meta-item">{count} sumcheck{'s' if count != 1 else ''}</p>
       </div>
     </a>""")
@@ -426,11 +502,8 @@ def _index_page(stages: dict[int, tuple[str, list]], total_stages: int = 7) -> s
   </p>
   {"".join(cards)}"""
 
-    # Reuse _page with extra CSS injected into body
-    return _page("Jolt Sumcheck Specifications", body, "index", total_stages).replace(
-        f"<style>{_CSS}</style>",
-        f"<style>{_CSS}{extra_css}</style>",
-    )
+    # Reuse _page with the index-specific CSS inlined
+    return _page("Jolt Sumcheck Specifications", body, "index", total_stages, extra_css=extra_css)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -446,37 +519,40 @@ def _openings_page(stages: dict[int, tuple[str, list]]) -> str:
     """
     # Collect: [(stage, sumcheck_name, poly_name, args)]
     entries: list[tuple[int, str, str, list[Arg]]] = []
-    for s in sorted(stages.keys()):
-        _title, specs = stages[s]
+    for s, (_title, specs) in stages.items():
         for spec in specs:
             for poly_name, args in spec.openings:
                 entries.append((s, spec.name, poly_name, args))
 
-    # Group by stage
-    body_parts = []
+    # Group by stage.  Blocks are newline-separated; each one is pushed
+    # as fragments and the body is joined once at the end.
+    body_parts: list[str] = []
+    extend = body_parts.extend
     current_stage = None
     for stage, sc_name, poly_name, args in entries:
         if stage != current_stage:
             if current_stage is not None:
-                body_parts.append("</div></section>")  # close prior card
+                extend(("\n", "</div></section>"))  # close prior card
             current_stage = stage
             stage_title = stages[stage][0]
-            body_parts.append(f"""
-    <section class="sumcheck-card">
-      <h3>Stage {stage} — {html_mod.escape(stage_title)}</h3>
-      <div class="openings-list">""")
-
-        entry_latex = latex_opening_entry(poly_name, args, _FMT)
-        link = f"stage{stage}.html#{html_mod.escape(sc_name)}"
-        body_parts.append(f"""
-        <div class="opening-row">
-          <a href="{link}" class="opening-source">{html_mod.escape(sc_name)}</a>
-          <span class="opening-arrow">→</span>
-          <span class="opening-poly">${entry_latex}$</span>
-        </div>""")
+            extend((
+                "\n" if body_parts else "",
+                '\n    <section class="sumcheck-card">\n      <h3>Stage ', str(stage),
+                " — ", _esc(stage_title),
+                '</h3>\n      <div class="openings-list">',
+            ))
+
+        escaped_name = _esc(sc_name)
+        extend((
+            '\n\n        <div class="opening-row">\n          <a href="stage', str(stage),
+            ".html#", escaped_name, '" class="opening-source">', escaped_name,
+            '</a>\n          <span class="opening-arrow">→</span>'
+            '\n          <span class="opening-poly">$', _opening_cached(poly_name, args),
+            "$</span>\n        </div>",
+        ))
 
     if current_stage is not None:
-        body_parts.append("</div></section>")
+        extend(("\n", "</div></section>"))
 
     extra_css = """
     .openings-list { display: flex; flex-direction: column; gap: 0.3rem; }
@@ -500,33 +576,30 @@ def _openings_page(stages: dict[int, tuple[str, list]]) -> str:
     .opening-poly { font-size: 0.9rem; }
     """
 
-    body = "\n".join(body_parts)
-    return _page("Openings Overview", body, "openings").replace(
-        f"<style>{_CSS}</style>",
-        f"<style>{_CSS}{extra_css}</style>",
-    )
+    body = "".join(body_parts)
+    return _page("Openings Overview", body, "openings", extra_css=extra_css)
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Polynomial registry page
 # ═══════════════════════════════════════════════════════════════════
 
+# (title, header class, polys, LaTeX colour) for each registry section
+_POLY_SECTIONS = (
+    ("Committed Polynomials", "committed-header", COMMITTED_POLYS, "ForestGreen"),
+    ("Virtual Polynomials", "virtual-header", VIRTUAL_POLYS, "BurntOrange"),
+    ("Verifier-Computable Polynomials", "verifier-header", VERIFIER_POLYS, None),
+)
+
+
 def _polynomials_page() -> str:
     """Generate the polynomial registry page.
 
     Shows all committed, virtual, and verifier-computable polynomials
     grouped by kind and category, plus the parameters table.
     """
-    from .registry import COMMITTED_POLYS, VIRTUAL_POLYS, VERIFIER_POLYS, PARAMS
-
-    _SECTIONS = [
-        ("Committed Polynomials", "committed-header", COMMITTED_POLYS, "ForestGreen"),
-        ("Virtual Polynomials", "virtual-header", VIRTUAL_POLYS, "BurntOrange"),
-        ("Verifier-Computable Polynomials", "verifier-header", VERIFIER_POLYS, None),
-    ]
-
     body_parts = []
-    for section_title, css_class, polys, colour in _SECTIONS:
+    for section_title, css_class, polys, colour in _POLY_SECTIONS:
         body_parts.append(f'<h2 class="poly-section-header {css_class}">{section_title}</h2>')
 
         # Group by category
@@ -536,7 +609,7 @@ def _polynomials_page() -> str:
                 current_cat = p.category
                 if current_cat:
                     body_parts.append(
-                        f'<h3 class="poly-category">{html_mod.escape(current_cat)}</h3>'
+                        f'<h3 class="poly-category">{_esc(current_cat)}</h3>'
                     )
 
             # Name with colour
@@ -557,7 +630,7 @@ def _polynomials_page() -> str:
         <div class="poly-entry">
           <div class="poly-name">${latex_name}$</div>
           {domain_html}
-          <div class="poly-desc">{html_mod.escape(p.description)}</div>
+          <div class="poly-desc">{_esc(p.description)}</div>
         </div>""")
 
     # Parameters table
@@ -571,13 +644,13 @@ def _polynomials_page() -> str:
       <tbody>""")
     for p in PARAMS:
         symbol_latex = _latex_param(p.symbol)
-        formula = html_mod.escape(p.formula) if p.formula else "—"
-        code = html_mod.escape(p.name) if p.name else "—"
+        formula = _esc(p.formula) if p.formula else "—"
+        code = _esc(p.name) if p.name else "—"
         body_parts.append(f"""
         <tr>
           <td>${symbol_latex}$</td>
           <td class="label">{code}</td>
-          <td>{html_mod.escape(p.description)}</td>
+          <td>{_esc(p.description)}</td>
           <td>{formula}</td>
         </tr>""")
     body_parts.append("</tbody></table></div>")
@@ -618,10 +691,7 @@ def _polynomials_page() -> str:
     """
 
     body = "\n".join(body_parts)
-    return _page("Polynomial Registry", body, "polynomials").replace(
-        f"<style>{_CSS}</style>",
-        f"<style>{_CSS}{extra_css}</style>",
-    )
+    return _page("Polynomial Registry", body, "polynomials", extra_css=extra_css)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -634,7 +704,19 @@ def _resolve_page() -> str:
     from .resolve import resolution_data
 
     data = resolution_data()
-    data_json = json.dumps(data, indent=None)
+    # Ship nodes and edges as positional rows with no optional
+    # whitespace; the script's destructuring maps restore the field names.
+    # Edge endpoints are indices into the node rows rather than repeated
+    # node ids.
+    node_index = {n["id"]: i for i, n in enumerate(data["nodes"])}
+    compact = {
+        "n": [[n["id"], n["label"], n["stage"], n["stage_title"], n["is_pcs"]]
+              for n in data["nodes"]],
+        "e": [[e["id"], node_index[e["source"]], node_index[e["target"]],
+               e["kind"], e["poly_names"]]
+              for e in data["edges"]],
+    }
+    data_json = json.dumps(compact, separators=(",", ":"))
 
     _STAGE_COLORS = {
         0: "#3fb950",  # PCS — green
@@ -758,16 +840,17 @@ def _resolve_page() -> str:
 
     cytoscape.use(cytoscapeDagre);
 
-    const cyNodes = RESOLVE_DATA.nodes.map(n => ({{
-      data: {{ ...n, color: STAGE_COLORS[n.stage] || '#888' }}
+    const cyNodes = RESOLVE_DATA.n.map(([id, label, stage, stage_title, is_pcs]) => ({{
+      data: {{ id, label, stage, stage_title, is_pcs, color: STAGE_COLORS[stage] || '#888' }}
     }}));
 
-    const cyEdges = RESOLVE_DATA.edges.map(e => {{
-      const polys = e.poly_names;
-      const shortLabel = polys.length <= 2
-        ? polys.join(', ')
-        : polys.slice(0, 2).join(', ') + ' +' + (polys.length - 2);
-      return {{ data: {{ ...e, label: shortLabel }} }};
+    const nodeIds = RESOLVE_DATA.n.map(n => n[0]);
+    const cyEdges = RESOLVE_DATA.e.map(([id, src, tgt, kind, poly_names]) => {{
+      const source = nodeIds[src], target = nodeIds[tgt];
+      const shortLabel = poly_names.length <= 2
+        ? poly_names.join(', ')
+        : poly_names.slice(0, 2).join(', ') + ' +' + (poly_names.length - 2);
+      return {{ data: {{ id, source, target, poly_names, kind, label: shortLabel }} }};
     }});
 
     const cy = cytoscape({{
@@ -945,10 +1028,7 @@ def _resolve_page() -> str:
     }});
   </script>"""
 
-    return _page("Resolve — Claim Flow DAG", body, "resolve").replace(
-        f"<style>{_CSS}</style>",
-        f"<style>{_CSS}{extra_css}</style>",
-    )
+    return _page("Resolve — Claim Flow DAG", body, "resolve", extra_css=extra_css)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -964,95 +1044,58 @@ def generate_html(out_dir: str | Path = "docs", stages: dict | None = None) -> N
                   If None, builds all stages from examples.
     """
     if stages is None:
-        stages = _default_stages()
+        from .examples import default_stages
+        stages = default_stages()  # already in stage order
+    else:
+        # Sort once here; every page helper iterates stages in key order.
+        stages = dict(sorted(stages.items()))
+
+    try:
+        _write_site(Path(out_dir), stages)
+    finally:
+        _RENDER_CACHE.clear()
+        _OPENING_CACHE.clear()
+
+
+def _stage_page(stage: int, title: str, specs: list) -> str:
+    """Generate one stage page: every spec of the stage, in order."""
+    body = "\n".join(_render_spec(spec) for spec in specs)
+    return _page(f"Stage {stage} — {title}", body, f"stage{stage}")
 
-    out = Path(out_dir)
+
+def _emit(path: Path, content: str) -> None:
+    """Write one generated file as UTF-8 (the pages declare it) and log it.
+
+    A file whose bytes already match is left alone, so its mtime only
+    moves when its content does.
+    """
+    data = content.encode("utf-8")
+    if path.is_file() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        print(f"  unchanged {path}")
+        return
+    path.write_bytes(data)
+    print(f"  wrote {path}")
+
+
+def _write_site(out: Path, stages: dict[int, tuple[str, list]]) -> None:
+    """Write every page of the site into out.  stages must be key-sorted."""
     out.mkdir(parents=True, exist_ok=True)
 
+    # Shared stylesheet, linked from every page
+    _emit(out / "style.css", _CSS)
+
     # Index page
-    (out / "index.html").write_text(_index_page(stages))
-    print(f"  wrote {out / 'index.html'}")
+    _emit(out / "index.html", _index_page(stages))
 
     # Per-stage pages
-    for s in sorted(stages.keys()):
-        title, specs = stages[s]
-        page_title = f"Stage {s} — {title}"
-        body = "\n".join(_render_spec(spec) for spec in specs)
-        html_content = _page(page_title, body, f"stage{s}")
-        path = out / f"stage{s}.html"
-        path.write_text(html_content)
-        print(f"  wrote {path}")
+    for s, (title, specs) in stages.items():
+        _emit(out / f"stage{s}.html", _stage_page(s, title, specs))
 
     # Openings overview page
-    (out / "openings.html").write_text(_openings_page(stages))
-    print(f"  wrote {out / 'openings.html'}")
+    _emit(out / "openings.html", _openings_page(stages))
 
     # Polynomial registry page
-    (out / "polynomials.html").write_text(_polynomials_page())
-    print(f"  wrote {out / 'polynomials.html'}")
+    _emit(out / "polynomials.html", _polynomials_page())
 
     # Resolve DAG page
-    (out / "resolve.html").write_text(_resolve_page())
-    print(f"  wrote {out / 'resolve.html'}")
-
-
-def _default_stages() -> dict[int, tuple[str, list]]:
-    """Build all stages from examples."""
-    from .examples import (
-        stage1_spartan_outer,
-        stage2_product_virtualization,
-        stage2_ram_read_write,
-        stage2_instruction_claim_reduction,
-        stage2_ram_raf_evaluation,
-        stage2_ram_output_check,
-        stage3_shift,
-        stage3_instruction_input,
-        stage3_registers_claim_reduction,
-        stage4_registers_read_write,
-        stage4_ram_val_check,
-        stage5_instruction_read_raf,
-        stage5_ram_ra_claim_reduction,
-        stage5_registers_val_evaluation,
-        stage6_ram_hamming_booleanity,
-        stage6_inc_claim_reduction,
-        stage6_bytecode_read_raf,
-        stage6_instruction_ra_virtualization,
-        stage6_ram_ra_virtualization,
-        stage6_booleanity,
-        stage7_hamming_weight_claim_reduction,
-    )
-    return {
-        1: ("Spartan", [stage1_spartan_outer()]),
-        2: ("Virtualization & RAM", [
-            stage2_product_virtualization(),
-            stage2_ram_read_write(),
-            stage2_instruction_claim_reduction(),
-            stage2_ram_raf_evaluation(),
-            stage2_ram_output_check(),
-        ]),
-        3: ("Shift & Instruction Input", [
-            stage3_shift(),
-            stage3_instruction_input(),
-            stage3_registers_claim_reduction(),
-        ]),
-        4: ("Registers & RAM Val", [
-            stage4_registers_read_write(),
-            stage4_ram_val_check(),
-        ]),
-        5: ("Instruction Read RAF & Reductions", [
-            stage5_instruction_read_raf(),
-            stage5_ram_ra_claim_reduction(),
-            stage5_registers_val_evaluation(),
-        ]),
-        6: ("Booleanity, Bytecode & Virtualization", [
-            stage6_ram_hamming_booleanity(),
-            stage6_inc_claim_reduction(),
-            stage6_bytecode_read_raf(),
-            stage6_instruction_ra_virtualization(),
-            stage6_ram_ra_virtualization(),
-            stage6_booleanity(),
-        ]),
-        7: ("Hamming Weight Claim Reduction", [
-            stage7_hamming_weight_claim_reduction(),
-        ]),
-    }
+    _emit(out / "resolve.html", _resolve_page())
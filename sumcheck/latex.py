@@ -25,9 +25,13 @@ _FMT = LatexFormat()
 # Helpers
 # ═══════════════════════════════════════════════════════════════════
 
+# LaTeX specials that can appear in spec names, labels and titles
+_ESCAPES = (("&", r"\&"), ("%", r"\%"), ("#", r"\#"), ("_", r"\_"))
+
+
 def _escape(s: str) -> str:
     """Escape LaTeX special characters in plain text."""
-    for ch, esc in [("&", r"\&"), ("%", r"\%"), ("#", r"\#"), ("_", r"\_")]:
+    for ch, esc in _ESCAPES:
         s = s.replace(ch, esc)
     return s
 
@@ -234,12 +238,14 @@ def generate_latex(out_file: str | Path = "sumcheck_specs.tex", stages: dict | N
                    If None, builds all stages from examples.
     """
     if stages is None:
-        stages = _default_stages()
+        from .examples import default_stages
+        stages = default_stages()  # already in stage order
+    else:
+        stages = dict(sorted(stages.items()))
 
     parts = [_PREAMBLE]
 
-    for s in sorted(stages.keys()):
-        title, specs = stages[s]
+    for s, (title, specs) in stages.items():
         parts.append(f"\n\\section{{Stage {s} --- {_escape(title)}}}\n\n")
         for spec in specs:
             parts.append(_render_spec(spec))
@@ -247,68 +253,12 @@ def generate_latex(out_file: str | Path = "sumcheck_specs.tex", stages: dict | N
 
     parts.append(_POSTAMBLE)
 
+    # The preamble declares inputenc utf8; don't depend on the locale
+    data = "".join(parts).encode("utf-8")
     out = Path(out_file)
-    out.write_text("".join(parts))
+    # Leave an identical file untouched so latexmk & co. see no change
+    if out.is_file() and out.stat().st_size == len(data) and out.read_bytes() == data:
+        print(f"  unchanged {out}")
+        return
+    out.write_bytes(data)
     print(f"  wrote {out}")
-
-
-def _default_stages() -> dict[int, tuple[str, list]]:
-    """Build all stages from examples."""
-    from .examples import (
-        stage1_spartan_outer,
-        stage2_product_virtualization,
-        stage2_ram_read_write,
-        stage2_instruction_claim_reduction,
-        stage2_ram_raf_evaluation,
-        stage2_ram_output_check,
-        stage3_shift,
-        stage3_instruction_input,
-        stage3_registers_claim_reduction,
-        stage4_registers_read_write,
-        stage4_ram_val_check,
-        stage5_instruction_read_raf,
-        stage5_ram_ra_claim_reduction,
-        stage5_registers_val_evaluation,
-        stage6_ram_hamming_booleanity,
-        stage6_inc_claim_reduction,
-        stage6_bytecode_read_raf,
-        stage6_instruction_ra_virtualization,
-        stage6_ram_ra_virtualization,
-        stage6_booleanity,
-        stage7_hamming_weight_claim_reduction,
-    )
-    return {
-        1: ("Spartan", [stage1_spartan_outer()]),
-        2: ("Virtualization & RAM", [
-            stage2_product_virtualization(),
-            stage2_ram_read_write(),
-            stage2_instruction_claim_reduction(),
-            stage2_ram_raf_evaluation(),
-            stage2_ram_output_check(),
-        ]),
-        3: ("Shift & Instruction Input", [
-            stage3_shift(),
-            stage3_instruction_input(),
-            stage3_registers_claim_reduction(),
-        ]),
-        4: ("Registers & RAM Val", [
-            stage4_registers_read_write(),
-            stage4_ram_val_check(),
-        ]),
-        5: ("Instruction Read RAF & Reductions", [
-            stage5_instruction_read_raf(),
-            stage5_ram_ra_claim_reduction(),
-            stage5_registers_val_evaluation(),
-        ]),
-        6: ("Booleanity, Bytecode & Virtualization", [
-            stage6_ram_hamming_booleanity(),
-            stage6_inc_claim_reduction(),
-            stage6_bytecode_read_raf(),
-            stage6_instruction_ra_virtualization(),
-            stage6_ram_ra_virtualization(),
-            stage6_booleanity(),
-        ]),
-        7: ("Hamming Weight Claim Reduction", [
-            stage7_hamming_weight_claim_reduction(),
-        ]),
-    }
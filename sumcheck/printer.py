@@ -18,6 +18,8 @@ See format.py for the per-node formatting system (TextFormat, LatexFormat, etc.)
 
 from __future__ import annotations
 
+import sys
+
 from .defs import Arg, Var, Opening
 from .ast import Expr
 from .spec import SumcheckSpec, SpartanSpec, ProductVirtSpec
@@ -68,34 +70,37 @@ def print_sumcheck(sc: SumcheckSpec) -> None:
           Openings produced:
             RamHammingWeight(r_cycle^(6))
     """
+    lines: list[str] = []
+    out = lines.append
     w = 60
-    print("=" * w)
-    print(f"  {sc.name}")
-    print("=" * w)
-    print(f"  Degree : {sc.degree}")
-    print(f"  Rounds : {sc.rounds}")
-    print()
+    out("=" * w)
+    out(f"  {sc.name}")
+    out("=" * w)
+    out(f"  Degree : {sc.degree}")
+    out(f"  Rounds : {sc.rounds}")
+    out("")
 
     vars_str = ", ".join(
         f"{v.name} ∈ {{0,1}}^{v.log_size}" for v in sc.sum_vars
     )
-    print(f"  Σ over : {vars_str}")
+    out(f"  Σ over : {vars_str}")
     if sc.opening_point:
         pt_str = ", ".join(_fmt_arg(o) for o in sc.opening_point)
-        print(f"  Opening: ({pt_str})")
-    print()
-    print(f"  RHS (input claim):")
-    print(f"    {fmt(sc.input_claim)}")
-    print()
-    print(f"  Integrand:")
-    print(f"    {fmt(sc.integrand)}")
-    print()
+        out(f"  Opening: ({pt_str})")
+    out("")
+    out(f"  RHS (input claim):")
+    out(f"    {fmt(sc.input_claim)}")
+    out("")
+    out(f"  Integrand:")
+    out(f"    {fmt(sc.integrand)}")
+    out("")
     if sc.openings:
-        print(f"  Openings produced:")
+        out(f"  Openings produced:")
         for name, args in sc.openings:
             arg_str = ", ".join(_fmt_arg(a) for a in args)
-            print(f"    {name}({arg_str})")
-    print()
+            out(f"    {name}({arg_str})")
+    out("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -104,47 +109,55 @@ def print_sumcheck(sc: SumcheckSpec) -> None:
 
 def print_product_virt(pv: ProductVirtSpec) -> None:
     """Pretty-print a product virtualization sumcheck."""
+    lines: list[str] = []
+    out = lines.append
     w = 72
-    print("=" * w)
-    print(f"  {pv.name}")
-    print("=" * w)
-    print(f"  {len(pv.constraints)} product constraints")
-    print(f"  Cycle var : {pv.cycle_var.name} ∈ {{0,1}}^{pv.cycle_var.log_size}")
-    print(f"  Constraint domain : {pv.constraint_domain}")
-    print(f"  Rounds : {pv.rounds}")
-    print()
-
-    print(f"  Integrand: eq(r_cycle^(1), {pv.cycle_var.name})")
-    print(f"           · L_{{τ_c}}(X_c)")
-    print(f"           · Left({pv.cycle_var.name}, X_c)")
-    print(f"           · Right({pv.cycle_var.name}, X_c)")
-    print()
-    print(f"  RHS: Σ_{{X_c}} L_{{τ_c}}(X_c) · Output(r_cycle^(1), X_c)")
-    print()
+    out("=" * w)
+    out(f"  {pv.name}")
+    out("=" * w)
+    out(f"  {len(pv.constraints)} product constraints")
+    out(f"  Cycle var : {pv.cycle_var.name} ∈ {{0,1}}^{pv.cycle_var.log_size}")
+    out(f"  Constraint domain : {pv.constraint_domain}")
+    out(f"  Rounds : {pv.rounds}")
+    out("")
+
+    out(f"  Integrand: eq(r_cycle^(1), {pv.cycle_var.name})")
+    out(f"           · L_{{τ_c}}(X_c)")
+    out(f"           · Left({pv.cycle_var.name}, X_c)")
+    out(f"           · Right({pv.cycle_var.name}, X_c)")
+    out("")
+    out(f"  RHS: Σ_{{X_c}} L_{{τ_c}}(X_c) · Output(r_cycle^(1), X_c)")
+    out("")
 
     # Table
-    out_strs  = [fmt(c.output) for c in pv.constraints]
-    left_strs = [fmt(c.left) for c in pv.constraints]
+    out_strs: list[str] = []
+    left_strs: list[str] = []
+    for c in pv.constraints:
+        out_strs.append(fmt(c.output))
+        left_strs.append(fmt(c.left))
     lbl_w = max(len(c.label) for c in pv.constraints)
-    out_w = max(len(s) for s in out_strs)
-    left_w = max(len(s) for s in left_strs)
+    out_w = max(map(len, out_strs))
+    left_w = max(map(len, left_strs))
     c_w = max(len(str(d)) for d in pv.constraint_domain)
 
     hdr = f"  {'c':>{c_w}}  {'label':<{lbl_w}}  {'Output':<{out_w}}  {'Left':<{left_w}}  Right"
-    print(hdr)
-    print(f"  {'─' * c_w}  {'─' * lbl_w}  {'─' * out_w}  {'─' * left_w}  {'─' * 30}")
+    out(hdr)
+    out(f"  {'─' * c_w}  {'─' * lbl_w}  {'─' * out_w}  {'─' * left_w}  {'─' * 30}")
 
+    # Rows
     for ci, c in enumerate(pv.constraints):
         idx = pv.constraint_domain[ci]
-        print(f"  {idx:>{c_w}}  {c.label:<{lbl_w}}  {out_strs[ci]:<{out_w}}  {left_strs[ci]:<{left_w}}  {fmt(c.right)}")
-    print()
+        out("  " + str(idx).rjust(c_w) + "  " + c.label.ljust(lbl_w) + "  "
+            + out_strs[ci].ljust(out_w) + "  " + left_strs[ci].ljust(left_w) + "  " + fmt(c.right))
+    out("")
 
     if pv.openings:
-        print(f"  Openings produced:")
+        out(f"  Openings produced:")
         for name, args in pv.openings:
             arg_str = ", ".join(_fmt_arg(a) for a in args)
-            print(f"    {name}({arg_str})")
-    print()
+            out(f"    {name}({arg_str})")
+    out("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_spartan(sp: SpartanSpec) -> None:
@@ -156,54 +169,62 @@ def print_spartan(sp: SpartanSpec) -> None:
 
     Column widths are auto-computed from content.
     """
+    lines: list[str] = []
+    out = lines.append
     w = 72
-    print("=" * w)
-    print(f"  {sp.name}")
-    print("=" * w)
-    print(f"  {sp.num_constraints} constraints in {len(sp.groups)} groups")
-    print(f"  Cycle var : {sp.cycle_var.name} ∈ {{0,1}}^{sp.cycle_var.log_size}")
-    print(f"  Group var : {sp.group_var.name} ∈ {{0,1}}")
-    print(f"  Constraint domain : {sp.constraint_domain}")
-    print()
+    out("=" * w)
+    out(f"  {sp.name}")
+    out("=" * w)
+    out(f"  {sp.num_constraints} constraints in {len(sp.groups)} groups")
+    out(f"  Cycle var : {sp.cycle_var.name} ∈ {{0,1}}^{sp.cycle_var.log_size}")
+    out(f"  Group var : {sp.group_var.name} ∈ {{0,1}}")
+    out(f"  Constraint domain : {sp.constraint_domain}")
+    out("")
 
     # The integrand structure is fixed for Spartan — show it explicitly
-    print(f"  Integrand: eq((τ_t, τ_b), ({sp.cycle_var.name}, {sp.group_var.name}))")
-    print(f"           · L_{{τ_c}}(X_c)")
-    print(f"           · Az({sp.cycle_var.name}, {sp.group_var.name}, X_c)")
-    print(f"           · Bz({sp.cycle_var.name}, {sp.group_var.name}, X_c)")
-    print()
-    print(f"  RHS: {fmt(sp.input_claim)}")
-    print()
+    out(f"  Integrand: eq((τ_t, τ_b), ({sp.cycle_var.name}, {sp.group_var.name}))")
+    out(f"           · L_{{τ_c}}(X_c)")
+    out(f"           · Az({sp.cycle_var.name}, {sp.group_var.name}, X_c)")
+    out(f"           · Bz({sp.cycle_var.name}, {sp.group_var.name}, X_c)")
+    out("")
+    out(f"  RHS: {fmt(sp.input_claim)}")
+    out("")
+
+    # Index column width is shared by every group's table
+    c_w = max(len(str(d)) for d in sp.constraint_domain)
 
     # Print each constraint group as a table
     for gi, group in enumerate(sp.groups):
-        print(f"  ── Group {gi} ({sp.group_var.name} = {gi}) ──")
-        print()
+        out(f"  ── Group {gi} ({sp.group_var.name} = {gi}) ──")
+        out("")
 
         # Pre-format all Az and Bz expressions
-        az_strs = [fmt(c.az) for c in group]
-        bz_strs = [fmt(c.bz) for c in group]
+        az_strs: list[str] = []
+        bz_strs: list[str] = []
+        for c in group:
+            az_strs.append(fmt(c.az))
+            bz_strs.append(fmt(c.bz))
 
         # Auto-size columns
         lbl_w = max(len(c.label) for c in group)
-        c_w = max(len(str(d)) for d in sp.constraint_domain)
-        az_w = max(len(s) for s in az_strs)
+        az_w = max(map(len, az_strs))
 
         # Header
         hdr = f"  {'c':>{c_w}}  {'label':<{lbl_w}}  {'Az (guard)':<{az_w}}  Bz (value)"
-        print(hdr)
-        print(f"  {'─' * c_w}  {'─' * lbl_w}  {'─' * az_w}  {'─' * 30}")
+        out(hdr)
+        out(f"  {'─' * c_w}  {'─' * lbl_w}  {'─' * az_w}  {'─' * 30}")
 
         # Rows
         for ci, (c, az_s, bz_s) in enumerate(zip(group, az_strs, bz_strs)):
             idx = sp.constraint_domain[ci] if ci < len(sp.constraint_domain) else ci
-            print(f"  {idx:>{c_w}}  {c.label:<{lbl_w}}  {az_s:<{az_w}}  {bz_s}")
-        print()
+            out("  " + str(idx).rjust(c_w) + "  " + c.label.ljust(lbl_w) + "  " + az_s.ljust(az_w) + "  " + bz_s)
+        out("")
 
     # Openings produced
     if sp.openings:
-        print(f"  Openings produced:")
+        out(f"  Openings produced:")
         for name, args in sp.openings:
             arg_str = ", ".join(_fmt_arg(a) for a in args)
-            print(f"    {name}({arg_str})")
-        print()
+            out(f"    {name}({arg_str})")
+        out("")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -12,6 +12,8 @@ Source: jolt-docs/content/references/polynomials.md
 
 from __future__ import annotations
 
+import sys
+
 from .defs import (
     DIM_ADDR,
     DIM_CYCLE,
@@ -30,7 +32,7 @@ from .defs import (
 # Parameters
 # ═══════════════════════════════════════════════════════════════════
 
-PARAMS: list[ParamDef] = [
+PARAMS: tuple[ParamDef, ...] = (
     ParamDef(
         "T",
         "trace_length",
@@ -103,7 +105,7 @@ PARAMS: list[ParamDef] = [
         "",
         "Number of lookup tables (42)",
     ),
-]
+)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -114,7 +116,7 @@ _C = PolyKind.COMMITTED
 _V = PolyKind.VIRTUAL
 _R = PolyKind.VERIFIER
 
-COMMITTED_POLYS: list[PolyDef] = [
+COMMITTED_POLYS: tuple[PolyDef, ...] = (
     PolyDef(
         "RdInc",
         _C,
@@ -164,14 +166,14 @@ COMMITTED_POLYS: list[PolyDef] = [
         "committed during proving; commitment included in proof",
         "Advice",
     ),
-]
+)
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Virtual polynomials
 # ═══════════════════════════════════════════════════════════════════
 
-VIRTUAL_POLYS: list[PolyDef] = [
+VIRTUAL_POLYS: tuple[PolyDef, ...] = (
     # Program counter
     PolyDef(
         "PC", _V, [DIM_CYCLE], "trace[t].pc (expanded ELF address)", "Program counter"
@@ -548,14 +550,14 @@ VIRTUAL_POLYS: list[PolyDef] = [
         "OpFlags(IsFirstInSequence)(t+1); left-shift by one cycle",
         "Shift-derived",
     ),
-]
+)
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Verifier-computable polynomials
 # ═══════════════════════════════════════════════════════════════════
 
-VERIFIER_POLYS: list[PolyDef] = [
+VERIFIER_POLYS: tuple[PolyDef, ...] = (
     PolyDef(
         "T_i",
         _R,
@@ -613,14 +615,20 @@ VERIFIER_POLYS: list[PolyDef] = [
         "Used in Stage 1 (S={-5,...,4}) and Stage 2 (S={-2,...,2}) for the 'univariate skip'",
         "Lagrange basis",
     ),
-]
+)
 
 
 # ═══════════════════════════════════════════════════════════════════
-# Convenience: all polynomials in one list
+# Convenience: all polynomials in one tuple
 # ═══════════════════════════════════════════════════════════════════
 
-ALL_POLYS: list[PolyDef] = COMMITTED_POLYS + VIRTUAL_POLYS + VERIFIER_POLYS
+ALL_POLYS: tuple[PolyDef, ...] = COMMITTED_POLYS + VIRTUAL_POLYS + VERIFIER_POLYS
+
+# Exact name → PolyDef for poly().  A few names exist in more than one
+# kind (InstructionRa(i) is both committed and virtual); building from
+# the reversed tuple keeps the first one in ALL_POLYS order, as a linear
+# scan would.
+_BY_NAME: dict[str, PolyDef] = {p.name: p for p in reversed(ALL_POLYS)}
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -636,20 +644,19 @@ class _PolyNamespace:
         InstructionRa(i)  → ns.InstructionRa_i
     """
 
-    def __init__(self, polys: list[PolyDef]):
-        self._by_name: dict[str, PolyDef] = {}
+    def __init__(self, polys: tuple[PolyDef, ...]):
+        # The PolyDefs are the instance's only attributes, so ns.Rs1Ra
+        # is an ordinary lookup and __dict__ doubles as the name map;
+        # __getattr__ below only runs for names that don't exist.
+        attrs = self.__dict__
         for p in polys:
-            safe = p.name.replace("(", "_").replace(")", "")
-            self._by_name[safe] = p
+            attrs[p.name.replace("(", "_").replace(")", "")] = p
 
     def __getattr__(self, name: str) -> PolyDef:
-        try:
-            return self._by_name[name]
-        except KeyError:
-            raise AttributeError(f"No polynomial named {name!r}")
+        raise AttributeError(f"No polynomial named {name!r}")
 
     def __dir__(self):
-        return list(self._by_name.keys())
+        return list(self.__dict__)
 
 
 committed = _PolyNamespace(COMMITTED_POLYS)
@@ -668,51 +675,62 @@ def poly(name: str) -> PolyDef:
         Rs1Ra = poly("Rs1Ra")
         Rs1Ra(X_k, X_t)   # → VirtualPoly("Rs1Ra", [X_k, X_t])
     """
-    for p in ALL_POLYS:
-        if p.name == name:
-            return p
-    raise KeyError(f"No polynomial named {name!r}")
+    try:
+        return _BY_NAME[name]
+    except KeyError:
+        raise KeyError(f"No polynomial named {name!r}") from None
+
+
+# ── print_registry display tables ──
+
+_KIND_MAP = {
+    "committed": PolyKind.COMMITTED,
+    "virtual": PolyKind.VIRTUAL,
+    "verifier": PolyKind.VERIFIER,
+}
+
+_KIND_LABEL = {
+    PolyKind.COMMITTED: "COMMITTED (green, cp:)",
+    PolyKind.VIRTUAL: "VIRTUAL (orange, vp:)",
+    PolyKind.VERIFIER: "VERIFIER-COMPUTABLE",
+}
+
+_CLR = {
+    PolyKind.COMMITTED: "\033[32m",  # green
+    PolyKind.VIRTUAL: "\033[33m",  # yellow/orange
+    PolyKind.VERIFIER: "\033[34m",  # blue
+}
+_RST = "\033[0m"
+_DIM = "\033[2m"
+_RULE = "=" * 60
 
 
 def print_registry(kinds: set[str] | None = None) -> None:
     """Pretty-print the polynomial registry."""
-    _KIND_MAP = {
-        "committed": PolyKind.COMMITTED,
-        "virtual": PolyKind.VIRTUAL,
-        "verifier": PolyKind.VERIFIER,
-    }
-    allowed = {_KIND_MAP[k] for k in kinds} if kinds else None
-
-    _CLR = {
-        PolyKind.COMMITTED: "\033[32m",  # green
-        PolyKind.VIRTUAL: "\033[33m",  # yellow/orange
-        PolyKind.VERIFIER: "\033[34m",  # blue
-    }
-    _RST = "\033[0m"
-    _DIM = "\033[2m"
+    if kinds:
+        allowed = frozenset(_KIND_MAP[k] for k in kinds)
+        polys = [p for p in ALL_POLYS if p.kind in allowed]
+    else:
+        polys = ALL_POLYS
+
+    lines: list[str] = []
+    out = lines.append
 
     current_kind = None
     current_cat = None
 
-    for p in ALL_POLYS:
-        if allowed and p.kind not in allowed:
-            continue
+    for p in polys:
         if p.kind != current_kind:
             current_kind = p.kind
-            label = {
-                PolyKind.COMMITTED: "COMMITTED (green, cp:)",
-                PolyKind.VIRTUAL: "VIRTUAL (orange, vp:)",
-                PolyKind.VERIFIER: "VERIFIER-COMPUTABLE",
-            }[p.kind]
-            print()
-            print(f"{'=' * 60}")
-            print(f"  {label}")
-            print(f"{'=' * 60}")
+            out("")
+            out(_RULE)
+            out(f"  {_KIND_LABEL[p.kind]}")
+            out(_RULE)
 
         if p.category != current_cat:
             current_cat = p.category
             if current_cat:
-                print(f"\n  -- {current_cat} --")
+                out(f"\n  -- {current_cat} --")
 
         clr = _CLR[p.kind]
         if p.domain:
@@ -721,15 +739,17 @@ def print_registry(kinds: set[str] | None = None) -> None:
             domain = f" : {_DIM}{dims} → F   [{labels}]{_RST}"
         else:
             domain = ""
-        print(f"    {clr}{p.name}{_RST}{domain}")
-        print(f"      {_DIM}{p.description}{_RST}")
+        out(f"    {clr}{p.name}{_RST}{domain}")
+        out(f"      {_DIM}{p.description}{_RST}")
 
-    print()
-    print(f"{'=' * 60}")
-    print(f"  PARAMETERS")
-    print(f"{'=' * 60}")
+    out("")
+    out(_RULE)
+    out("  PARAMETERS")
+    out(_RULE)
     for p in PARAMS:
         formula = f" = {p.formula}" if p.formula else ""
         code = f" ({p.name})" if p.name else ""
-        print(f"    {p.symbol}{code}{formula}")
-        print(f"      {p.description}")
+        out(f"    {p.symbol}{code}{formula}")
+        out(f"      {p.description}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
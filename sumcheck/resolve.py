@@ -16,6 +16,8 @@ Usage:
 
 from __future__ import annotations
 import re
+import sys
+from functools import lru_cache
 
 from .defs import Var, Opening, Arg
 from .ast import (
@@ -31,43 +33,79 @@ from .registry import ALL_POLYS
 # AST walker
 # ═══════════════════════════════════════════════════════════════════
 
+# Per-node handlers for _collect.  Each one records a leaf in out or
+# pushes the node's children onto stack; binary nodes push right then
+# left, so operands pop off (and are collected) in source order.
+
+def _collect_cp(e: CommittedPoly, stack: list[Expr], out: list) -> None:
+    out.append(("cp", e.name, tuple(e.args)))
+
+
+def _collect_vp(e: VirtualPoly, stack: list[Expr], out: list) -> None:
+    out.append(("vp", e.name, tuple(e.args)))
+
+
+def _collect_verifier(e: VerifierPoly, stack: list[Expr], out: list) -> None:
+    out.append(("verifier", e.name, tuple(e.args)))
+
+
+def _collect_none(e: Expr, stack: list[Expr], out: list) -> None:
+    pass
+
+
+def _collect_binop(e: Add | Mul, stack: list[Expr], out: list) -> None:
+    stack.append(e.right)
+    stack.append(e.left)
+
+
+def _collect_pow(e: Pow, stack: list[Expr], out: list) -> None:
+    stack.append(e.base)
+
+
+def _collect_neg(e: Neg, stack: list[Expr], out: list) -> None:
+    stack.append(e.expr)
+
+
+def _collect_body(e: Sum | FSum | Prod, stack: list[Expr], out: list) -> None:
+    stack.append(e.body)
+
+
+# Exact-type dispatch: every AST node class is concrete
+_COLLECT_DISPATCH = {
+    CommittedPoly: _collect_cp,
+    VirtualPoly: _collect_vp,
+    VerifierPoly: _collect_verifier,
+    Const: _collect_none,
+    Add: _collect_binop,
+    Mul: _collect_binop,
+    Pow: _collect_pow,
+    Neg: _collect_neg,
+    Sum: _collect_body,
+    FSum: _collect_body,
+    Prod: _collect_body,
+}
+
+
 def _collect(expr: Expr, out: list[tuple[str, str, tuple]]) -> None:
-    """Recursively collect (kind, name, args) from an expression."""
-    if isinstance(expr, CommittedPoly):
-        out.append(("cp", expr.name, tuple(expr.args)))
-    elif isinstance(expr, VirtualPoly):
-        out.append(("vp", expr.name, tuple(expr.args)))
-    elif isinstance(expr, VerifierPoly):
-        out.append(("verifier", expr.name, tuple(expr.args)))
-    elif isinstance(expr, Const):
-        pass
-    elif isinstance(expr, Add):
-        _collect(expr.left, out)
-        _collect(expr.right, out)
-    elif isinstance(expr, Mul):
-        _collect(expr.left, out)
-        _collect(expr.right, out)
-    elif isinstance(expr, Pow):
-        _collect(expr.base, out)
-    elif isinstance(expr, Neg):
-        _collect(expr.expr, out)
-    elif isinstance(expr, Sum):
-        _collect(expr.body, out)
-    elif isinstance(expr, (FSum, Prod)):
-        _collect(expr.body, out)
+    """Collect (kind, name, args) from an expression, in pre-order.
+
+    Walks an explicit stack rather than recursing; unknown node types
+    are skipped.
+    """
+    stack = [expr]
+    pop = stack.pop
+    get = _COLLECT_DISPATCH.get
+    while stack:
+        e = pop()
+        get(type(e), _collect_none)(e, stack, out)
 
 
 def collect_polys(expr: Expr) -> list[tuple[str, str, tuple]]:
     """Extract unique (kind, name, args) triples from an expression."""
     raw: list[tuple[str, str, tuple]] = []
     _collect(expr, raw)
-    seen: set[tuple[str, str, tuple]] = set()
-    result = []
-    for item in raw:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    # dict keeps first-seen order, so this drops repeats in one pass
+    return list(dict.fromkeys(raw))
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -84,8 +122,7 @@ def _rhs_polys(spec) -> list[tuple[str, str, tuple]]:
         raw: list[tuple[str, str, tuple]] = []
         for c in spec.constraints:
             _collect(c.output, raw)
-        seen: set[tuple[str, str, tuple]] = set()
-        return [x for x in raw if not (x in seen or seen.add(x))]
+        return list(dict.fromkeys(raw))
     elif isinstance(spec, SumcheckSpec):
         return collect_polys(spec.input_claim)
     return []
@@ -97,63 +134,58 @@ def _opened_claims(spec) -> list[tuple[str, str, list[Arg]]]:
     kind is inferred: names starting with known committed patterns → 'cp',
     otherwise 'vp'. The `openings` field gives (name, [args]).
     """
-    if not hasattr(spec, 'openings'):
+    if not hasattr(spec, 'openings') or not spec.openings:
         return []
+    # Walk the integrand once for all of this spec's openings: distinct
+    # cp/vp (kind, name) pairs in first-seen order, each with its
+    # parametric base precomputed for the fallback match.
+    opened = dict.fromkeys(
+        (kind, pname) for kind, pname, _ in _integrand_polys(spec)
+        if kind in ("cp", "vp")
+    )
+    exact: dict[str, str] = {}
+    for kind, pname in opened:
+        exact.setdefault(pname, kind)
+    candidates = [(kind, pname, pname.split("(")[0]) for kind, pname in opened]
     results = []
     for name, args in spec.openings:
         # Infer kind from the spec's integrand/constraints
-        kind = _infer_opened_kind(spec, name)
+        kind = exact.get(name) or _infer_opened_kind(candidates, name)
         results.append((kind, name, args))
     return results
 
 
-def _infer_opened_kind(spec, name: str) -> str:
-    """Infer whether an opened poly is cp or vp from the integrand."""
-    # Walk the integrand to find the poly
+def _integrand_polys(spec) -> list[tuple[str, str, tuple]]:
+    """Every poly occurrence in the spec's integrand/constraints, in order."""
+    raw: list[tuple[str, str, tuple]] = []
     if isinstance(spec, SumcheckSpec):
-        polys = collect_polys(spec.integrand)
+        _collect(spec.integrand, raw)
     elif isinstance(spec, SpartanSpec):
-        raw: list[tuple[str, str, tuple]] = []
         for g in spec.groups:
             for c in g:
                 _collect(c.az, raw)
                 _collect(c.bz, raw)
-        polys = raw
     elif isinstance(spec, ProductVirtSpec):
-        raw = []
         for c in spec.constraints:
             _collect(c.left, raw)
             _collect(c.right, raw)
-        polys = raw
-    else:
-        polys = []
+    return raw
 
-    for kind, pname, _ in polys:
-        if pname == name and kind in ("cp", "vp"):
-            return kind
-    # If the name contains a parametric pattern, try base match
-    for kind, pname, _ in polys:
-        if kind in ("cp", "vp") and _name_matches(pname, name):
-            return kind
-    return "vp"  # default to vp
 
+def _infer_opened_kind(candidates: list[tuple[str, str, str]], name: str) -> str:
+    """Infer cp/vp for an opening with no exact-name match in the integrand.
 
-def _name_matches(integrand_name: str, opening_name: str) -> bool:
-    """Check if an integrand poly name matches an opening name.
-
+    candidates holds (kind, integrand_name, base) for the integrand's
+    cp/vp polys, base being the name with any "(...)" suffix removed.
     Handles cases like integrand 'Ra_j' matching opening 'Ra_j for j=0..d-1'.
     """
-    # Exact match
-    if integrand_name == opening_name:
-        return True
-    # Opening name might be descriptive: "Ra_j for j=0..d-1 (...)"
-    if opening_name.startswith(integrand_name):
-        return True
-    # Strip parametric suffixes
-    base_i = integrand_name.split("(")[0] if "(" in integrand_name else integrand_name
-    base_o = opening_name.split("(")[0] if "(" in opening_name else opening_name
-    base_o = base_o.split(" ")[0]  # strip "for j=0..." descriptions
-    return base_i == base_o
+    # Strip parametric suffixes and "for j=0..." descriptions
+    base_o = name.split("(")[0].split(" ")[0]
+    for kind, pname, base_i in candidates:
+        # Opening name might be descriptive: "Ra_j for j=0..d-1 (...)"
+        if name.startswith(pname) or base_i == base_o:
+            return kind
+    return "vp"  # default to vp
 
 
 def _spec_name(spec) -> str:
@@ -164,6 +196,9 @@ def _spec_name(spec) -> str:
 # Claim key for matching
 # ═══════════════════════════════════════════════════════════════════
 
+_RE_PARAMETRIC = re.compile(r'^(.+)\(([a-z][a-z0-9_]*)\)$')
+
+
 def _is_parametric(name: str) -> tuple[str, str] | None:
     """Check if a name is parametric: 'Base(param)' where param starts lowercase.
 
@@ -172,36 +207,39 @@ def _is_parametric(name: str) -> tuple[str, str] | None:
 
     Returns (base, param) or None.
     """
-    m = re.match(r'^(.+)\(([a-z][a-z0-9_]*)\)$', name)
+    m = _RE_PARAMETRIC.match(name)
     if m:
         return m.group(1), m.group(2)
     return None
 
 
-def _claim_key(name: str, args: list[Arg] | tuple) -> str:
-    """Create a hashable key for matching claims: 'name@point'.
+@lru_cache(maxsize=4096)
+def _base_name(name: str) -> str:
+    """Strip a descriptive suffix: 'Ra_j for j=0..d-1' → 'Ra_j'."""
+    return name.split(" for ", 1)[0].strip()
+
+
+# (name, opening point) — the point is the rendered Opening args only
+_ClaimKey = tuple[str, tuple[str, ...]]
+
+
+def _claim_key(name: str, args: list[Arg] | tuple) -> _ClaimKey:
+    """Create a hashable key for matching claims: (name, point).
 
     Only Opening args contribute to the point (Vars are summation vars,
     not part of the opening point).
     """
-    point_parts = []
-    for a in args:
-        if isinstance(a, Opening):
-            point_parts.append(_fmt_arg(a))
-    point = ", ".join(point_parts)
+    point = tuple(_fmt_arg(a) for a in args if isinstance(a, Opening))
     # Normalize name: strip descriptive suffixes like "for j=0..."
-    base = name.split(" for ")[0].strip()
-    return f"{base}@({point})" if point else f"{base}@()"
+    return _base_name(name), point
 
 
-def _fmt_claim(kind: str, name: str, args) -> str:
-    """Format a claim for display."""
+def _fmt_claim(kind: str, key: _ClaimKey) -> str:
+    """Format a claim for display from its _claim_key (name, point)."""
     clr = _CLR.get(kind, "")
-    point_parts = [_fmt_arg(a) for a in args if isinstance(a, Opening)]
-    point = ", ".join(point_parts)
-    base = name.split(" for ")[0].strip()
+    base, point = key
     if point:
-        return f"{clr}{kind}:{base}{_RST}({point})"
+        return f"{clr}{kind}:{base}{_RST}({', '.join(point)})"
     return f"{clr}{kind}:{base}{_RST}"
 
 
@@ -210,11 +248,16 @@ def _fmt_claim(kind: str, name: str, args) -> str:
 # ═══════════════════════════════════════════════════════════════════
 
 _REGISTRY_NAMES: set[str] | None = None
+# Registry names plus the base of each parametric one ("Foo(i)" → "Foo")
+_REGISTRY_BASES: set[str] | None = None
 
 def _get_registry_names() -> set[str]:
-    global _REGISTRY_NAMES
+    global _REGISTRY_NAMES, _REGISTRY_BASES
     if _REGISTRY_NAMES is None:
         _REGISTRY_NAMES = {p.name for p in ALL_POLYS}
+        _REGISTRY_BASES = _REGISTRY_NAMES | {
+            rn[:rn.index("(")] for rn in _REGISTRY_NAMES if "(" in rn
+        }
     return _REGISTRY_NAMES
 
 
@@ -223,10 +266,7 @@ def _in_registry(name: str) -> bool:
     if name in registry:
         return True
     if "(" in name:
-        base = name[:name.index("(")]
-        for rn in registry:
-            if rn.startswith(base + "(") or rn == base:
-                return True
+        return name[:name.index("(")] in _REGISTRY_BASES
     return False
 
 
@@ -245,9 +285,14 @@ _BOLD = "\033[1m"
 _RED = "\033[31m"
 _GREEN = "\033[32m"
 
+_RULE = "=" * 72
+_SPEC_RULE = "  " + "─" * 68
+
+_RE_ANSI = re.compile(r'\033\[[0-9;]*m')
+
 
 def _strip_ansi(s: str) -> str:
-    return re.sub(r'\033\[[0-9;]*m', '', s)
+    return _RE_ANSI.sub('', s)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -256,90 +301,35 @@ def _strip_ansi(s: str) -> str:
 
 def print_resolution() -> None:
     """Walk all stages, track opening claims, print resolution status."""
-    from .examples import (
-        stage1_spartan_outer,
-        stage2_product_virtualization,
-        stage2_ram_read_write,
-        stage2_instruction_claim_reduction,
-        stage2_ram_raf_evaluation,
-        stage2_ram_output_check,
-        stage3_shift,
-        stage3_instruction_input,
-        stage3_registers_claim_reduction,
-        stage4_registers_read_write,
-        stage4_ram_val_check,
-        stage5_instruction_read_raf,
-        stage5_ram_ra_claim_reduction,
-        stage5_registers_val_evaluation,
-        stage6_ram_hamming_booleanity,
-        stage6_inc_claim_reduction,
-        stage6_bytecode_read_raf,
-        stage6_instruction_ra_virtualization,
-        stage6_ram_ra_virtualization,
-        stage6_booleanity,
-        stage7_hamming_weight_claim_reduction,
-    )
+    from .examples import default_stages
 
-    stages: list[tuple[int, str, list]] = [
-        (1, "SPARTAN", [stage1_spartan_outer()]),
-        (2, "VIRTUALIZATION & RAM", [
-            stage2_product_virtualization(),
-            stage2_ram_read_write(),
-            stage2_instruction_claim_reduction(),
-            stage2_ram_raf_evaluation(),
-            stage2_ram_output_check(),
-        ]),
-        (3, "SHIFT & INSTRUCTION INPUT", [
-            stage3_shift(),
-            stage3_instruction_input(),
-            stage3_registers_claim_reduction(),
-        ]),
-        (4, "REGISTERS & RAM VAL", [
-            stage4_registers_read_write(),
-            stage4_ram_val_check(),
-        ]),
-        (5, "INSTRUCTION READ RAF & REDUCTIONS", [
-            stage5_instruction_read_raf(),
-            stage5_ram_ra_claim_reduction(),
-            stage5_registers_val_evaluation(),
-        ]),
-        (6, "BOOLEANITY, BYTECODE & VIRTUALIZATION", [
-            stage6_ram_hamming_booleanity(),
-            stage6_inc_claim_reduction(),
-            stage6_bytecode_read_raf(),
-            stage6_instruction_ra_virtualization(),
-            stage6_ram_ra_virtualization(),
-            stage6_booleanity(),
-        ]),
-        (7, "HAMMING WEIGHT CLAIM REDUCTION", [
-            stage7_hamming_weight_claim_reduction(),
-        ]),
-    ]
+    lines: list[str] = []
+    out = lines.append
 
     # Outstanding claims: key → (kind, name, args, source_stage, source_name)
-    outstanding: dict[str, tuple[str, str, list, int, str]] = {}
+    outstanding: dict[_ClaimKey, tuple[str, str, list, int, str]] = {}
     # Resolved claims: key → (resolved_by_stage, resolved_by_name)
-    resolved_log: list[tuple[str, str, str, int, str, int, str]] = []
+    resolved_log: list[tuple[_ClaimKey, str, str, int, str, int, str]] = []
     all_errors: list[str] = []
 
-    for stage_num, stage_title, specs in stages:
-        print()
-        print(f"{'=' * 72}")
-        print(f"  STAGE {stage_num} — {stage_title}")
-        print(f"{'=' * 72}")
+    for stage_num, (stage_title, specs) in default_stages().items():
+        out("")
+        out(_RULE)
+        out(f"  STAGE {stage_num} — {stage_title.upper()}")
+        out(_RULE)
 
         for spec in specs:
             name = _spec_name(spec)
             rhs = _rhs_polys(spec)
             opened = _opened_claims(spec)
 
-            print()
-            print(f"  {_BOLD}{name}{_RST}")
-            print(f"  {'─' * 68}")
+            out("")
+            out(f"  {_BOLD}{name}{_RST}")
+            out(_SPEC_RULE)
 
             # ── Consumed: RHS polys that resolve outstanding claims ──
             consumed: list[str] = []
-            rhs_unmatched: list[tuple[str, str, tuple]] = []
+            rhs_unmatched: list[tuple[str, _ClaimKey]] = []
 
             for kind, pname, args in rhs:
                 if kind == "verifier":
@@ -348,7 +338,7 @@ def print_resolution() -> None:
                 if key in outstanding:
                     src = outstanding[key]
                     consumed.append(
-                        f"  {_GREEN}✓{_RST} {_fmt_claim(kind, pname, args)}"
+                        f"  {_GREEN}✓{_RST} {_fmt_claim(kind, key)}"
                         f" {_DIM}← S{src[3]} {src[4]}{_RST}"
                     )
                     resolved_log.append((
@@ -359,23 +349,21 @@ def print_resolution() -> None:
                     del outstanding[key]
                 else:
                     # Try parametric matching: OpFlags(cf_i) resolves all OpFlags(*)
-                    base_name = pname.split(" for ")[0].strip()
+                    base_name, point = key
                     param = _is_parametric(base_name)
                     if param:
-                        base, _ = param
-                        point_parts = [_fmt_arg(a) for a in args if isinstance(a, Opening)]
-                        point_suffix = "@(" + ", ".join(point_parts) + ")"
+                        prefix = param[0] + "("
                         matches = [
                             okey for okey in outstanding
-                            if okey.endswith(point_suffix)
-                            and okey[:-len(point_suffix)].startswith(base + "(")
-                            and okey[:-len(point_suffix)].endswith(")")
+                            if okey[1] == point
+                            and okey[0].startswith(prefix)
+                            and okey[0].endswith(")")
                         ]
                         if matches:
                             for okey in sorted(matches):
                                 src = outstanding[okey]
                                 consumed.append(
-                                    f"  {_GREEN}✓{_RST} {_fmt_claim(src[0], src[1], src[2])}"
+                                    f"  {_GREEN}✓{_RST} {_fmt_claim(src[0], okey)}"
                                     f" {_DIM}← S{src[3]} {src[4]}{_RST}"
                                 )
                                 resolved_log.append((
@@ -385,66 +373,67 @@ def print_resolution() -> None:
                                 ))
                                 del outstanding[okey]
                         else:
-                            rhs_unmatched.append((kind, pname, args))
+                            rhs_unmatched.append((kind, key))
                     else:
                         # Not in outstanding — could be a public input or error
-                        rhs_unmatched.append((kind, pname, args))
+                        rhs_unmatched.append((kind, key))
 
             if consumed:
-                print(f"  {_DIM}Consumes (resolves prior claims):{_RST}")
-                for line in consumed:
-                    print(line)
+                out(f"  {_DIM}Consumes (resolves prior claims):{_RST}")
+                lines.extend(consumed)
             if rhs_unmatched:
-                print(f"  {_DIM}RHS (public inputs / constants):{_RST}")
-                for kind, pname, args in rhs_unmatched:
-                    print(f"    {_fmt_claim(kind, pname, args)}")
+                out(f"  {_DIM}RHS (public inputs / constants):{_RST}")
+                for kind, key in rhs_unmatched:
+                    out(f"    {_fmt_claim(kind, key)}")
             if not consumed and not rhs_unmatched:
                 rhs_const = collect_polys(
                     spec.input_claim if hasattr(spec, 'input_claim') else Const(0)
                 )
                 if not any(k in ("vp", "cp") for k, _, _ in rhs_const):
-                    print(f"  {_DIM}RHS = constant{_RST}")
+                    out(f"  {_DIM}RHS = constant{_RST}")
 
             # ── Produced: new opening claims ──
             if opened:
-                print(f"  {_DIM}Produces (new opening claims):{_RST}")
+                out(f"  {_DIM}Produces (new opening claims):{_RST}")
                 for kind, oname, oargs in opened:
                     key = _claim_key(oname, oargs)
-                    fmt = _fmt_claim(kind, oname, oargs)
+                    fmt = _fmt_claim(kind, key)
                     if kind == "cp":
-                        print(f"    {_GREEN}●{_RST} {fmt} {_DIM}→ PCS-verified{_RST}")
+                        out(f"    {_GREEN}●{_RST} {fmt} {_DIM}→ PCS-verified{_RST}")
                     else:
-                        print(f"    ○ {fmt} {_DIM}→ unresolved{_RST}")
+                        out(f"    ○ {fmt} {_DIM}→ unresolved{_RST}")
                     outstanding[key] = (kind, oname, oargs, stage_num, name)
 
     # ── Summary ──
-    print()
-    print(f"{'=' * 72}")
-    print(f"  SUMMARY")
-    print(f"{'=' * 72}")
-    print(f"  Claims resolved across stages: {len(resolved_log)}")
+    out("")
+    out(_RULE)
+    out(f"  SUMMARY")
+    out(_RULE)
+    out(f"  Claims resolved across stages: {len(resolved_log)}")
 
     # Check remaining outstanding
     remaining_vp = {k: v for k, v in outstanding.items() if v[0] == "vp"}
     remaining_cp = {k: v for k, v in outstanding.items() if v[0] == "cp"}
 
     if remaining_cp:
-        print(f"  Committed claims (PCS-verified): {len(remaining_cp)}")
+        out(f"  Committed claims (PCS-verified): {len(remaining_cp)}")
     if remaining_vp:
-        print()
-        print(f"  {_RED}UNRESOLVED virtual claims ({len(remaining_vp)}):{_RST}")
+        out("")
+        out(f"  {_RED}UNRESOLVED virtual claims ({len(remaining_vp)}):{_RST}")
         for key, (kind, oname, oargs, src_s, src_n) in sorted(remaining_vp.items()):
-            print(f"    ✗ {_fmt_claim(kind, oname, oargs)} from S{src_s} {src_n}")
+            out(f"    ✗ {_fmt_claim(kind, key)} from S{src_s} {src_n}")
         all_errors.extend(
             f"Unresolved vp: {v[1]} from S{v[3]} {v[4]}"
             for v in remaining_vp.values()
         )
     else:
-        print(f"\n  {_GREEN}All virtual claims resolved ✓{_RST}")
+        out(f"\n  {_GREEN}All virtual claims resolved ✓{_RST}")
 
     if all_errors:
-        print(f"\n  {_RED}{len(all_errors)} issues found{_RST}")
-    print()
+        out(f"\n  {_RED}{len(all_errors)} issues found{_RST}")
+    out("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -465,65 +454,7 @@ def resolution_data() -> dict:
     that committed-poly claims flow into (they are verified by the PCS,
     not by a later sumcheck).
     """
-    from .examples import (
-        stage1_spartan_outer,
-        stage2_product_virtualization,
-        stage2_ram_read_write,
-        stage2_instruction_claim_reduction,
-        stage2_ram_raf_evaluation,
-        stage2_ram_output_check,
-        stage3_shift,
-        stage3_instruction_input,
-        stage3_registers_claim_reduction,
-        stage4_registers_read_write,
-        stage4_ram_val_check,
-        stage5_instruction_read_raf,
-        stage5_ram_ra_claim_reduction,
-        stage5_registers_val_evaluation,
-        stage6_ram_hamming_booleanity,
-        stage6_inc_claim_reduction,
-        stage6_bytecode_read_raf,
-        stage6_instruction_ra_virtualization,
-        stage6_ram_ra_virtualization,
-        stage6_booleanity,
-        stage7_hamming_weight_claim_reduction,
-    )
-
-    stages_list: list[tuple[int, str, list]] = [
-        (1, "Spartan", [stage1_spartan_outer()]),
-        (2, "Virtualization & RAM", [
-            stage2_product_virtualization(),
-            stage2_ram_read_write(),
-            stage2_instruction_claim_reduction(),
-            stage2_ram_raf_evaluation(),
-            stage2_ram_output_check(),
-        ]),
-        (3, "Shift & Instruction Input", [
-            stage3_shift(),
-            stage3_instruction_input(),
-            stage3_registers_claim_reduction(),
-        ]),
-        (4, "Registers & RAM Val", [
-            stage4_registers_read_write(),
-            stage4_ram_val_check(),
-        ]),
-        (5, "Instruction Read RAF & Reductions", [
-            stage5_instruction_read_raf(),
-            stage5_ram_ra_claim_reduction(),
-            stage5_registers_val_evaluation(),
-        ]),
-        (6, "Booleanity, Bytecode & Virtualization", [
-            stage6_ram_hamming_booleanity(),
-            stage6_inc_claim_reduction(),
-            stage6_bytecode_read_raf(),
-            stage6_instruction_ra_virtualization(),
-            stage6_ram_ra_virtualization(),
-            stage6_booleanity(),
-        ]),
-        (7, "Hamming Weight Claim Reduction", [
-            stage7_hamming_weight_claim_reduction(),
-        ]),
-    ]
+    from .examples import default_stages
 
     PCS_ID = "PCS"
     nodes: list[dict] = [
@@ -535,17 +466,17 @@ def resolution_data() -> dict:
     edge_map: dict[tuple[str, str, str], list[str]] = {}
 
     # claim_key → {node_id, kind, name}
-    outstanding: dict[str, dict] = {}
+    outstanding: dict[_ClaimKey, dict] = {}
 
     def _add_edge(source: str, target: str, poly_name: str, kind: str) -> None:
         k = (source, target, kind)
         if k not in edge_map:
             edge_map[k] = []
-        clean = poly_name.split(" for ")[0].strip()
+        clean = _base_name(poly_name)
         if clean not in edge_map[k]:
             edge_map[k].append(clean)
 
-    for stage_num, stage_title, specs in stages_list:
+    for stage_num, (stage_title, specs) in default_stages().items():
         for spec in specs:
             node_id = f"S{stage_num}_{spec.name}"
             nodes.append({
@@ -569,17 +500,15 @@ def resolution_data() -> dict:
                     _add_edge(src["node_id"], node_id, pname, src["kind"])
                 else:
                     # Parametric matching
-                    base_name = pname.split(" for ")[0].strip()
+                    base_name, point = key
                     param = _is_parametric(base_name)
                     if param:
-                        base, _ = param
-                        point_parts = [_fmt_arg(a) for a in args if isinstance(a, Opening)]
-                        point_suffix = "@(" + ", ".join(point_parts) + ")"
+                        prefix = param[0] + "("
                         matches = [
-                            okey for okey in list(outstanding.keys())
-                            if okey.endswith(point_suffix)
-                            and okey[:-len(point_suffix)].startswith(base + "(")
-                            and okey[:-len(point_suffix)].endswith(")")
+                            okey for okey in outstanding
+                            if okey[1] == point
+                            and okey[0].startswith(prefix)
+                            and okey[0].endswith(")")
                         ]
                         for okey in sorted(matches):
                             src = outstanding.pop(okey)
@@ -598,7 +527,7 @@ def resolution_data() -> dict:
         else:
             unresolved.append({
                 "source_id": src["node_id"],
-                "poly_name": src["name"].split(" for ")[0].strip(),
+                "poly_name": _base_name(src["name"]),
                 "kind": src["kind"],
             })
 
@@ -72,7 +72,7 @@ from .ast import Expr, degree
 # Single sumcheck (Stages 2–7)
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class SumcheckSpec:
     """A single-integrand sumcheck: Σ_{vars} integrand = input_claim.
 
@@ -109,7 +109,7 @@ class SumcheckSpec:
 # R1CS constraint row (for Spartan)
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     """One row of the R1CS constraint table.
 
@@ -142,7 +142,7 @@ class Constraint:
 # Product constraint row (for Stage 2 product virtualization)
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class ProductConstraint:
     """One product constraint: output = left · right.
 
@@ -170,7 +170,7 @@ class ProductConstraint:
 # Product virtualization spec (Stage 2)
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class ProductVirtSpec:
     """Product virtualization sumcheck — proves output = left · right.
 
@@ -198,7 +198,7 @@ class ProductVirtSpec:
 # Spartan outer sumcheck (Stage 1)
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class SpartanSpec:
     """Spartan outer sumcheck — batched R1CS constraint satisfaction.
 